@@ -3,20 +3,32 @@ Circuit execution API endpoints.
 
 This module contains endpoints for quantum circuit execution.
 """
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, status
-from typing import Dict, Any, Optional
+from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, Depends, UploadFile, status
+from typing import Dict, Any, Optional, TypedDict
+import asyncio
+import hashlib
 import uuid
 import os
-import json
+import orjson
+import aiofiles
 from datetime import datetime
+from collections import OrderedDict
+from functools import lru_cache
 import time
 
 from app.schemas.circuit import (
+    BackendType,
     CircuitExecutionRequest,
     CircuitExecutionResponse,
+    HardwareProvider,
     JobStatus,
+    SimulatorProvider,
 )
-from app.core.logging import get_logger
+from app.core.config import settings
+from app.core.logging import get_logger, request_id_var
+from app.services.job_queue import enqueue_execution, load_job_record, save_job_record
+from app.utils.error_handling import raise_api_error
+from app.services.result_writer import enqueue_write
 from app.services.circuit_executor import (
     execute_circuit_with_qiskit,
     execute_circuit_with_braket,
@@ -24,7 +36,6 @@ from app.services.circuit_executor import (
     execute_circuit_with_ibm_hardware,
     execute_circuit_with_aws_hardware,
     execute_circuit_with_google_hardware,
-    check_provider_availability,
 )
 
 # Setup router
@@ -33,27 +44,195 @@ router = APIRouter()
 # Setup logger
 logger = get_logger(__name__)
 
-# Directory paths for storing circuits and results
+# Directory paths for storing circuits and results (created once at
+# application startup by the lifespan handler in app.main)
 CIRCUITS_DIR = "circuits"
 RESULTS_DIR = "results"
 
-# Ensure directories exist
-os.makedirs(CIRCUITS_DIR, exist_ok=True)
-os.makedirs(RESULTS_DIR, exist_ok=True)
 
-# In-memory job store (in production, use a database)
-jobs = {}
+@lru_cache(maxsize=1024)
+def _ensure_dir(dirpath: str) -> None:
+    """Create a storage shard directory once; cached so repeats cost nothing."""
+    os.makedirs(dirpath, exist_ok=True)
 
 
+def _circuit_path(job_id: str) -> str:
+    """
+    Path of the stored circuit file for a job.
+
+    Files are sharded into 256 subdirectories by job-id prefix so flat-dir
+    lookups don't degrade as the job count grows.
+    """
+    shard = f"{CIRCUITS_DIR}/{job_id[:2]}"
+    _ensure_dir(shard)
+    return f"{shard}/{job_id}.qasm"
+
+
+def _result_path(job_id: str) -> str:
+    """Path of the stored result file for a job (sharded like circuits)."""
+    shard = f"{RESULTS_DIR}/{job_id[:2]}"
+    _ensure_dir(shard)
+    return f"{shard}/{job_id}.json"
+
+
+# Valid provider names per backend type, computed once at import time so
+# request validation is a set lookup instead of a per-request list build
+SIMULATOR_PROVIDERS = frozenset(provider.value for provider in SimulatorProvider)
+HARDWARE_PROVIDERS = frozenset(provider.value for provider in HardwareProvider)
+
+# Provider dispatch tables resolved once at import, replacing the
+# if/elif chains that were walked on every execution
+SIMULATOR_EXECUTORS = {
+    "qiskit": execute_circuit_with_qiskit,
+    "braket": execute_circuit_with_braket,
+    "cirq": execute_circuit_with_cirq,
+}
+HARDWARE_EXECUTORS = {
+    "ibm": execute_circuit_with_ibm_hardware,
+    "aws": execute_circuit_with_aws_hardware,
+    "google": execute_circuit_with_google_hardware,
+}
+
+# datetime.now resolved once at import; the attribute lookup otherwise
+# happens twice per request (job creation and completion timestamps)
+_now = datetime.now
+
+
+class JobRecord(TypedDict, total=False):
+    """
+    In-memory job record.
+
+    Kept dict-backed (rather than a slotted class) because records are
+    mutated in place across modules and round-trip through Redis hashes
+    field by field; the TypedDict documents the shape without changing
+    runtime behavior.
+    """
+    job_id: str
+    status: str
+    created_at: str
+    completed_at: str
+    circuit_path: str
+    circuit_content: Optional[str]
+    parameters: Optional[Dict[str, Any]]
+    shots: int
+    backend_type: str
+    backend_provider: str
+    backend_name: Optional[str]
+    provider_job_id: Optional[str]
+    provider_job_status: Optional[str]
+    error: str
+
+# In-memory job store (in production, use a database). Insertion order is
+# kept so the oldest records can be evicted once MAX_TRACKED_JOBS is hit,
+# and each job gets its own asyncio.Lock so state mutations never race.
+jobs: "OrderedDict[str, JobRecord]" = OrderedDict()
+_job_locks: Dict[str, asyncio.Lock] = {}
+
+
+def _register_job(job: JobRecord) -> None:
+    """Track a job record, evicting the oldest records beyond the cap."""
+    jobs[job["job_id"]] = job
+    _job_locks[job["job_id"]] = asyncio.Lock()
+    while len(jobs) > settings.MAX_TRACKED_JOBS:
+        evicted_id, _ = jobs.popitem(last=False)
+        _job_locks.pop(evicted_id, None)
+
+# Bound concurrent circuit executions to keep CPU/memory usage predictable
+_execution_semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_EXECUTIONS)
+
+# LRU cache of successful simulator results keyed by
+# (circuit sha256, shots, provider). Hardware runs are never cached and
+# parameterized circuits bypass it since parameters change the outcome.
+_result_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
+
+def _result_cache_get(key: tuple) -> Optional[Dict[str, Any]]:
+    """Return a cached result and refresh its LRU position, or None."""
+    result = _result_cache.get(key)
+    if result is not None:
+        _result_cache.move_to_end(key)
+    return result
+
+
+def _result_cache_put(key: tuple, result: Dict[str, Any]) -> None:
+    """Cache a result, evicting the least recently used beyond the cap."""
+    if settings.RESULT_CACHE_SIZE <= 0:
+        return
+    _result_cache[key] = result
+    _result_cache.move_to_end(key)
+    while len(_result_cache) > settings.RESULT_CACHE_SIZE:
+        _result_cache.popitem(last=False)
+
+
+def validate_execution_request(request: CircuitExecutionRequest) -> CircuitExecutionRequest:
+    """
+    Validate the provider/backend_type pairing for an execution request.
+
+    Runs as a dependency so invalid requests are rejected before the
+    handler body does any work, using the validation set that matches the
+    requested backend type.
+
+    Args:
+        request: Parsed circuit execution request
+
+    Returns:
+        The validated request
+
+    Raises:
+        HTTPException: If the provider is not valid for the backend type,
+            or the circuit payload exceeds MAX_CIRCUIT_BYTES
+    """
+    # Reject oversized circuits before any disk or executor work happens.
+    # The error shape is static per process, so the cached HTTPException
+    # from raise_api_error is reused across requests.
+    if (
+        request.circuit_file is not None
+        and len(request.circuit_file) > settings.MAX_CIRCUIT_BYTES
+    ):
+        raise_api_error(
+            "CIRCUIT_TOO_LARGE",
+            (
+                f"Circuit payload exceeds the maximum size of "
+                f"{settings.MAX_CIRCUIT_BYTES} bytes"
+            ),
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        )
+
+    _validate_provider(request.backend_type, request.backend_provider)
+    return request
+
+
+def _validate_provider(backend_type: BackendType, backend_provider: str) -> None:
+    """Raise a 400 if the provider is not valid for the backend type."""
+    valid_providers = (
+        SIMULATOR_PROVIDERS
+        if backend_type == BackendType.SIMULATOR
+        else HARDWARE_PROVIDERS
+    )
+    if backend_provider not in valid_providers:
+        # Each error shape's HTTPException is built once and reused; the
+        # LRU bound on the cache keeps arbitrary provider strings from
+        # growing it without limit
+        raise_api_error(
+            "VALIDATION_ERROR",
+            (
+                f"Invalid backend provider '{backend_provider}' "
+                f"for backend type '{backend_type.value}'"
+            ),
+        )
+
+
+# No response_model: the envelope is a plain dict already, and declaring
+# Dict[str, Any] only adds a FastAPI validation/serialization pass per response
 @router.post(
     "/execute",
-    response_model=Dict[str, Any],
     status_code=status.HTTP_200_OK,
     summary="Execute a quantum circuit",
     description="Submit a quantum circuit for execution on a selected backend",
 )
 async def execute_circuit(
-    request: CircuitExecutionRequest, background_tasks: BackgroundTasks
+    background_tasks: BackgroundTasks,
+    request: CircuitExecutionRequest = Depends(validate_execution_request),
 ) -> Dict[str, Any]:
     """
     Execute a quantum circuit on a selected backend.
@@ -73,46 +252,55 @@ async def execute_circuit(
     Raises:
         HTTPException: If the backend provider is invalid or unavailable
     """
-    job_id = str(uuid.uuid4())
-    circuit_path = f"{CIRCUITS_DIR}/{job_id}.qasm"
+    # .hex skips the dash-formatting work of str(uuid4())
+    job_id = uuid.uuid4().hex
+    circuit_path = _circuit_path(job_id)
     # If no circuit provided, try reading default circuit
     if request.circuit_file is None:
         default_circuit_dir = os.path.join(CIRCUITS_DIR, "default")
         try:
-            # List files in the default directory
-            default_files = [f for f in os.listdir(default_circuit_dir) if os.path.isfile(os.path.join(default_circuit_dir, f))]
+            # List files in the default directory (in a thread: listdir and
+            # the per-entry stat calls are blocking)
+            default_files = await asyncio.to_thread(
+                lambda: [
+                    f
+                    for f in os.listdir(default_circuit_dir)
+                    if os.path.isfile(os.path.join(default_circuit_dir, f))
+                ]
+            )
             if not default_files:
                 raise FileNotFoundError("No files found in default circuit directory")
 
             # Take the first file found
             default_file_path = os.path.join(default_circuit_dir, default_files[0])
-            logger.info(f"No circuit provided, using default: {default_file_path}")
-            with open(default_file_path, "r") as f:
-                request.circuit_file = f.read()
+            logger.info("No circuit provided, using default: %s", default_file_path)
+            async with aiofiles.open(default_file_path, "r") as f:
+                request.circuit_file = await f.read()
         except FileNotFoundError:
              raise HTTPException(
                 status_code=400,
                 detail=f"No circuit provided and default circuit directory '{default_circuit_dir}' not found or empty."
             )
         except Exception as e:
-            logger.error(f"Error reading default circuit from {default_circuit_dir}: {e}", exc_info=True)
+            logger.error("Error reading default circuit from %s: %s", default_circuit_dir, e, exc_info=True)
             raise HTTPException(
                 status_code=500, # Use 500 for unexpected server errors
                 detail=f"Error reading default circuit file: {str(e)}"
             )
 
-    # Save circuit
+    # Save circuit (async so the disk write doesn't block the event loop)
     try:
-        with open(circuit_path, "w") as f:
-            f.write(request.circuit_file)
+        async with aiofiles.open(circuit_path, "w") as f:
+            await f.write(request.circuit_file)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to save circuit file: {str(e)}")
 
     job = {
         "job_id": job_id,
         "status": JobStatus.QUEUED.value,
-        "created_at": datetime.now().isoformat(),
+        "created_at": _now().isoformat(),
         "circuit_path": circuit_path,
+        "circuit_content": request.circuit_file,
         "parameters": request.parameters,
         "shots": request.shots,
         "backend_type": request.backend_type.value,
@@ -121,34 +309,171 @@ async def execute_circuit(
         "provider_job_id": None,  # Initialize provider fields
         "provider_job_status": None,
     }
-    jobs[job_id] = job
-    
-    # Determine execution mode
-    if not request.async_mode:
-        # Execute synchronously
-        exec_result = await _execute_circuit(job_id)
-        
-        # Refresh job data after execution (it might have been updated with provider info)
-        job = jobs.get(job_id, job) 
-        
+    _register_job(job)
+
+    # Identical simulator circuits can reuse a cached result instead of
+    # re-simulating; hardware and parameterized runs always execute
+    cache_key = None
+    if (
+        request.backend_type == BackendType.SIMULATOR
+        and not request.async_mode
+        and not request.parameters
+    ):
+        # Single-shot C-level hash; the first 16 digest bytes are plenty
+        # for cache keying and skip the hex-formatting allocation
+        circuit_hash = hashlib.sha256(request.circuit_file.encode("utf-8")).digest()[:16]
+        cache_key = (circuit_hash, request.shots, request.backend_provider)
+
+    return await _dispatch_job(
+        job, request.async_mode, background_tasks, cache_key=cache_key
+    )
+
+
+@router.post(
+    "/execute-upload",
+    status_code=status.HTTP_200_OK,
+    summary="Execute an uploaded quantum circuit",
+    description="Submit a quantum circuit as a file upload for execution on a selected backend",
+)
+async def execute_circuit_upload(
+    background_tasks: BackgroundTasks,
+    circuit: UploadFile = File(..., description="OpenQASM circuit file"),
+    shots: int = Form(1024),
+    backend_type: BackendType = Form(...),
+    backend_provider: str = Form(...),
+    backend_name: Optional[str] = Form(None),
+    async_mode: bool = Form(False),
+) -> Dict[str, Any]:
+    """
+    Execute an uploaded quantum circuit on a selected backend.
+
+    Unlike the JSON endpoint, the circuit is streamed from the upload to
+    disk in fixed-size chunks, so memory use stays constant regardless of
+    circuit size.
+
+    Args:
+        background_tasks: FastAPI background tasks handler
+        circuit: Uploaded OpenQASM circuit file
+        shots: Number of execution shots
+        backend_type: Backend type (simulator or hardware)
+        backend_provider: Provider name
+        backend_name: Specific backend name if applicable
+        async_mode: Flag for asynchronous execution
+
+    Returns:
+        Either circuit execution results (synchronous mode) or job creation
+        confirmation (asynchronous mode)
+
+    Raises:
+        HTTPException: If the backend provider is invalid or the upload
+            exceeds MAX_CIRCUIT_BYTES
+    """
+    _validate_provider(backend_type, backend_provider)
+
+    job_id = uuid.uuid4().hex
+    circuit_path = _circuit_path(job_id)
+
+    # Stream the upload straight to the circuit file; no full-string copy
+    # of the QASM is ever held in memory
+    size = 0
+    try:
+        async with aiofiles.open(circuit_path, "wb") as f:
+            while chunk := await circuit.read(65536):
+                size += len(chunk)
+                if size > settings.MAX_CIRCUIT_BYTES:
+                    raise_api_error(
+                        "CIRCUIT_TOO_LARGE",
+                        (
+                            f"Circuit upload exceeds the maximum size of "
+                            f"{settings.MAX_CIRCUIT_BYTES} bytes"
+                        ),
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    )
+                await f.write(chunk)
+    except HTTPException:
+        await asyncio.to_thread(os.remove, circuit_path)
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to save circuit file: {str(e)}")
+
+    # circuit_content stays None so executors read the stored file instead
+    # of an in-memory copy
+    job = {
+        "job_id": job_id,
+        "status": JobStatus.QUEUED.value,
+        "created_at": _now().isoformat(),
+        "circuit_path": circuit_path,
+        "circuit_content": None,
+        "parameters": None,
+        "shots": shots,
+        "backend_type": backend_type.value,
+        "backend_provider": backend_provider,
+        "backend_name": backend_name,
+        "provider_job_id": None,
+        "provider_job_status": None,
+    }
+    _register_job(job)
+
+    return await _dispatch_job(job, async_mode, background_tasks)
+
+
+async def _dispatch_job(
+    job: JobRecord,
+    async_mode: bool,
+    background_tasks: BackgroundTasks,
+    cache_key: Optional[tuple] = None,
+) -> Dict[str, Any]:
+    """
+    Run or enqueue a registered job and build its API response.
+
+    Shared tail of the execution endpoints: synchronous jobs run inline
+    (optionally served from the result cache), asynchronous jobs are
+    enqueued on the Redis task queue or handed to background tasks.
+
+    Args:
+        job: Registered job record
+        async_mode: Whether the caller requested asynchronous execution
+        background_tasks: FastAPI background tasks handler
+        cache_key: Result-cache key for cacheable simulator runs, if any
+
+    Returns:
+        The response envelope for the execution endpoint
+    """
+    job_id = job["job_id"]
+
+    if not async_mode:
+        # Execute synchronously (serving from the result cache when possible)
+        exec_result = _result_cache_get(cache_key) if cache_key is not None else None
+        if exec_result is not None:
+            job["status"] = JobStatus.COMPLETED.value
+        else:
+            exec_result = await _execute_circuit(job_id)
+            if cache_key is not None and exec_result.get("success", False):
+                _result_cache_put(cache_key, exec_result)
+
+        # No re-fetch needed: _execute_circuit mutates this same record in
+        # place, so provider info is already visible here
+
         if exec_result.get("success", False):
             return {
                 "status": "success",
-                "data": CircuitExecutionResponse(
+                # model_construct skips re-validation; every field here is
+                # server-generated, so there is nothing left to validate
+                "data": CircuitExecutionResponse.model_construct(
                     job_id=job_id,
-                    status=job.get("status", JobStatus.COMPLETED.value),
+                    status=JobStatus(job.get("status", JobStatus.COMPLETED.value)),
                     execution_mode="sync",
                     execution_time=exec_result.get("execution_time"),
                     counts=exec_result.get("counts", {}),
                     provider_job_id=job.get("provider_job_id"),  # Read from updated job record
                     provider_job_status=job.get("provider_job_status"), # Read from updated job record
                     metadata={
-                        "backend_type": request.backend_type.value,
-                        "backend_provider": request.backend_provider,
-                        "backend_name": request.backend_name,
-                        "shots": request.shots
+                        "backend_type": job["backend_type"],
+                        "backend_provider": job["backend_provider"],
+                        "backend_name": job["backend_name"],
+                        "shots": job["shots"]
                     }
-                ).dict(),
+                ).model_dump(mode="json"),
                 "error": None
             }
         else:
@@ -158,12 +483,17 @@ async def execute_circuit(
                 "error": exec_result.get("error", "Unknown execution error")
             }
     else:
-        # Run in background
-        background_tasks.add_task(_execute_circuit, job_id)
-        
+        # Enqueue on the Redis-backed task queue so execution can scale to
+        # worker processes; fall back to in-process background execution
+        # when no queue is available. The record is mirrored to Redis first
+        # so a worker in another process can pick it up.
+        await save_job_record(job)
+        if not await enqueue_execution(job_id):
+            background_tasks.add_task(_execute_circuit, job_id)
+
         return {
             "status": "success",
-            "data": CircuitExecutionResponse(
+            "data": CircuitExecutionResponse.model_construct(
                 job_id=job_id,
                 status=JobStatus.QUEUED,
                 execution_mode="async",
@@ -171,13 +501,13 @@ async def execute_circuit(
                 provider_job_id=None,  # Initially None, will be updated after execution
                 provider_job_status=None,  # Initially None, will be updated after execution
                 metadata={
-                    "backend_type": request.backend_type.value,
-                    "backend_provider": request.backend_provider,
-                    "backend_name": request.backend_name,
-                    "shots": request.shots,
+                    "backend_type": job["backend_type"],
+                    "backend_provider": job["backend_provider"],
+                    "backend_name": job["backend_name"],
+                    "shots": job["shots"],
                     "created_at": job["created_at"]
                 }
-            ).dict(),
+            ).model_dump(mode="json"),
             "error": None
         }
 
@@ -192,16 +522,35 @@ async def _execute_circuit(job_id: str) -> Dict[str, Any]:
     Returns:
         Execution results (including success status, counts/error, metadata)
     """
-    if job_id not in jobs:
-        logger.error(f"Job {job_id} not found")
-        return {"success": False, "error": "Job not found"}
-    
+    # Correlate every log line emitted while this job runs — including
+    # those from the executor and runner modules — with its job id
+    token = request_id_var.set(job_id)
+    try:
+        if job_id not in jobs:
+            # Jobs enqueued by another process live in Redis, not local memory
+            job = await load_job_record(job_id)
+            if job is None:
+                logger.error("Job %s not found", job_id)
+                return {"success": False, "error": "Job not found"}
+            _register_job(job)
+
+        # Serialize execution and state mutation per job so the sync path,
+        # queue workers and background tasks never race on the same record
+        async with _job_locks.setdefault(job_id, asyncio.Lock()):
+            return await _run_job(job_id)
+    finally:
+        request_id_var.reset(token)
+
+
+async def _run_job(job_id: str) -> Dict[str, Any]:
+    """Execute a registered job; caller must hold the job's lock."""
     job = jobs[job_id]
     job["status"] = JobStatus.RUNNING.value
     
     try:
         # Get circuit and parameters
         circuit_path = job["circuit_path"]
+        circuit_content = job.get("circuit_content")
         parameters = job["parameters"] or {}
         shots = job["shots"]
         provider = job["backend_provider"]
@@ -209,38 +558,32 @@ async def _execute_circuit(job_id: str) -> Dict[str, Any]:
         backend_name = job["backend_name"]
         
         start_time = time.time()
-        
-        # Execute on appropriate backend
-        if backend_type == "simulator":
-            if provider == "qiskit":
-                exec_result = await execute_circuit_with_qiskit(circuit_path, parameters, shots)
-                counts = exec_result.get("counts")
-                exec_metadata = exec_result.get("metadata", {})
-            elif provider == "braket":
-                exec_result = await execute_circuit_with_braket(circuit_path, parameters, shots)
-                counts = exec_result.get("counts")
-                exec_metadata = exec_result.get("metadata", {})
-            elif provider == "cirq":
-                exec_result = await execute_circuit_with_cirq(circuit_path, parameters, shots)
-                counts = exec_result.get("counts")
-                exec_metadata = exec_result.get("metadata", {})
-            else:
-                raise ValueError(f"Unsupported simulator provider: {provider}")
-        elif backend_type == "hardware":
-            if provider == "ibm":
-                exec_result = await execute_circuit_with_ibm_hardware(circuit_path, parameters, shots, backend_name)
-            elif provider == "aws":
-                exec_result = await execute_circuit_with_aws_hardware(circuit_path, parameters, shots, backend_name)
-            elif provider == "google":
-                exec_result = await execute_circuit_with_google_hardware(circuit_path, parameters, shots, backend_name)
+
+        # Execute on appropriate backend, bounding how many circuits run at
+        # once so a burst of requests cannot exhaust CPU and memory
+        async with _execution_semaphore:
+            if backend_type == "simulator":
+                executor = SIMULATOR_EXECUTORS.get(provider)
+                if executor is None:
+                    raise ValueError(f"Unsupported simulator provider: {provider}")
+                exec_result = await executor(circuit_path, parameters, shots, circuit_content)
+            elif backend_type == "hardware":
+                executor = HARDWARE_EXECUTORS.get(provider)
+                if executor is None:
+                    raise ValueError(f"Unsupported hardware provider: {provider}")
+                exec_result = await executor(circuit_path, parameters, shots, backend_name)
             else:
-                raise ValueError(f"Unsupported hardware provider: {provider}")
-                
-            # Extract counts and metadata from the full result
-            counts = exec_result.get("counts")
+                raise ValueError(f"Unsupported backend type: {backend_type}")
+
+        # Normalize the executor result in one place: hardware runners may
+        # return a full result envelope with counts/metadata keys, while
+        # the simulator executors return the raw counts dict itself
+        if isinstance(exec_result, dict) and "counts" in exec_result:
+            counts = exec_result["counts"]
             exec_metadata = exec_result.get("metadata", {})
         else:
-            raise ValueError(f"Unsupported backend type: {backend_type}")
+            counts = exec_result
+            exec_metadata = {}
         
         execution_time = time.time() - start_time
         
@@ -248,8 +591,9 @@ async def _execute_circuit(job_id: str) -> Dict[str, Any]:
         job["provider_job_id"] = exec_metadata.get("provider_job_id")
         job["provider_job_status"] = exec_metadata.get("status")
         job["status"] = JobStatus.COMPLETED.value
-        logger.info(f"Stored provider job ID {job['provider_job_id']} for job {job_id}")
-        logger.info(f"Job {job_id} completed")
+        logger.info("Stored provider job ID %s for job %s", job["provider_job_id"], job_id)
+        logger.info("Job %s completed", job_id)
+        await save_job_record(job)
 
         # Save results (including updated metadata)
         result_data = {
@@ -266,30 +610,29 @@ async def _execute_circuit(job_id: str) -> Dict[str, Any]:
                 "shots": shots,
                 "parameters": parameters,
                 "created_at": job["created_at"],
-                "completed_at": datetime.now().isoformat(),
+                "completed_at": _now().isoformat(),
                 **exec_metadata # Include any other metadata from the runner
             },
             "success": True
         }
         
-        result_path = f"{RESULTS_DIR}/{job_id}.json"
-        with open(result_path, "w") as f:
-            json.dump(result_data, f, indent=2)
-        
+        result_path = _result_path(job_id)
+        await enqueue_write(result_path, orjson.dumps(result_data))
+
         return result_data # Return the full result data
 
     except Exception as e:
         error_msg = f"Error executing job {job_id}: {str(e)}"
         logger.error(error_msg, exc_info=True)
         job["status"] = JobStatus.FAILED.value
+        await save_job_record(job)
         
         # Save error information
         result_data = {"success": False, "error": error_msg, "counts": None, "metadata": {}}
-        result_path = f"{RESULTS_DIR}/{job_id}.json"
+        result_path = _result_path(job_id)
         try:
-            with open(result_path, "w") as f:
-                json.dump(result_data, f, indent=2)
+            await enqueue_write(result_path, orjson.dumps(result_data))
         except Exception as write_e:
-            logger.error(f"Failed to write error results for job {job_id}: {write_e}")
-            
+            logger.error("Failed to write error results for job %s: %s", job_id, write_e)
+
         return result_data
@@ -32,31 +32,34 @@ except ImportError:
 
 router = APIRouter()
 
+# Health payload built once at import: simulator availability and configured
+# credentials don't change at runtime, and load balancers poll this endpoint
+# constantly, so there is no reason to rebuild the same dict per request
+_HEALTH_PAYLOAD = {
+    "status": "healthy",
+    "api_version": settings.PROJECT_VERSION,
+    "simulators": {
+        "qiskit": QISKIT_AVAILABLE,
+        "cirq": CIRQ_AVAILABLE,
+        "braket": BRAKET_AVAILABLE
+    },
+    "hardware_connections": {
+        "ibm": bool(settings.IBM_QUANTUM_TOKEN),
+        "aws": bool(settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY),
+        "google": False  # Google requires additional setup
+    }
+}
+
 
 @router.get("/health", response_model=ResponseBase[Dict[str, Any]])
 async def health_check() -> ResponseBase[Dict[str, Any]]:
     """
     Health check endpoint.
-    
+
     Returns information about the API's health, available simulators, and
     potential hardware connections.
-    
+
     Returns:
         Response with health status information
     """
-    health_data = {
-        "status": "healthy",
-        "api_version": settings.PROJECT_VERSION,
-        "simulators": {
-            "qiskit": QISKIT_AVAILABLE,
-            "cirq": CIRQ_AVAILABLE,
-            "braket": BRAKET_AVAILABLE
-        },
-        "hardware_connections": {
-            "ibm": bool(settings.IBM_QUANTUM_TOKEN),
-            "aws": bool(settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY),
-            "google": False  # Google requires additional setup
-        }
-    }
-    
-    return ResponseBase.success(health_data)
+    return ResponseBase.success(_HEALTH_PAYLOAD)
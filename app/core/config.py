@@ -3,7 +3,7 @@ Configuration module for the Quantum Computing API.
 
 This module contains configuration settings and environment variables for the application.
 """
-import os
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -25,6 +25,7 @@ class Settings(BaseSettings):
         AWS_SECRET_ACCESS_KEY: AWS secret access key
         AWS_REGION: AWS region
         TOGETHER_API_KEY: Together API key
+        REDIS_URL: Redis connection URL for the async job queue
     """
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "Quantum Computing API"
@@ -43,6 +44,29 @@ class Settings(BaseSettings):
     # Paths for storing circuits and results
     CIRCUITS_DIR: str = "circuits"
     RESULTS_DIR: str = "results"
+
+    # Redis connection URL for the async job queue (optional; in-process
+    # background execution is used when unset or unreachable)
+    REDIS_URL: Optional[str] = Field(None, env="REDIS_URL")
+
+    # Lifetime of job records mirrored into Redis hashes
+    JOB_RECORD_TTL_SECONDS: int = 86400
+
+    # Maximum number of circuits executing concurrently per process
+    MAX_CONCURRENT_EXECUTIONS: int = 10
+
+    # Cap on in-memory job records; the oldest are evicted beyond this
+    MAX_TRACKED_JOBS: int = 1000
+
+    # Largest accepted circuit payload, in bytes
+    MAX_CIRCUIT_BYTES: int = 1_048_576
+
+    # Entries kept in the simulator result cache (0 disables caching)
+    RESULT_CACHE_SIZE: int = 128
+
+    # Threads in the shared pool for blocking SDK/file calls
+    # (defaults to 2x CPU count when unset)
+    MAX_WORKER_THREADS: Optional[int] = None
     
     class Config:
         """Pydantic Config class."""
@@ -50,9 +74,19 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
-# Create an instance of the settings
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Build the Settings instance once and reuse it.
+
+    Settings() parses the environment and reads .env on every call; the
+    cache makes repeated lookups (tests, dependencies, ad-hoc scripts) free.
+
+    Returns:
+        The cached Settings instance
+    """
+    return Settings()
+
 
-# Create directories if they don't exist
-os.makedirs(settings.CIRCUITS_DIR, exist_ok=True)
-os.makedirs(settings.RESULTS_DIR, exist_ok=True)
+# Shared instance for modules that import settings directly
+settings = get_settings()
@@ -4,12 +4,29 @@ Logging configuration for the Quantum Computing API.
 This module sets up structured logging for the application with appropriate
 log levels and handlers.
 """
+import atexit
 import logging
+import queue
 import sys
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, Any
 
 from app.core.config import settings
 
+# Correlation id for the request/job currently being handled. ContextVar
+# lookups are O(1) and scoped per asyncio task, so concurrent coroutines
+# each see their own id without locks or thread-local fallbacks.
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+
+class _RequestIdFilter(logging.Filter):
+    """Stamp the current correlation id onto every log record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
 
 def setup_logging() -> None:
     """
@@ -21,19 +38,36 @@ def setup_logging() -> None:
     log_level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
     
     # Configure logging format
-    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    log_format = '%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s'
     date_format = '%Y-%m-%d %H:%M:%S'
     
+    # Route records through a queue so emitting a log line never blocks
+    # the caller on a disk write; a listener thread drains the queue into
+    # the real stream/file handlers
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue,
+        logging.StreamHandler(sys.stdout),
+        logging.FileHandler("quantum_api.log"),
+        respect_handler_level=True,
+    )
+
+    # The filter runs on the producing side of the queue, so the context
+    # variable is read in the task that emitted the record, not the
+    # listener thread
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(_RequestIdFilter())
+
     # Setup basic configuration
     logging.basicConfig(
         level=log_level,
         format=log_format,
         datefmt=date_format,
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler("quantum_api.log")
-        ]
+        handlers=[queue_handler]
     )
+
+    listener.start()
+    atexit.register(listener.stop)
     
     # Reduce verbosity of some loggers
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -6,7 +6,7 @@ This module contains the request and response schemas for circuit execution.
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class BackendType(str, Enum):
@@ -42,14 +42,31 @@ class CircuitExecutionRequest(BaseModel):
         async_mode: Boolean flag for asynchronous execution
         parameters: Dictionary of circuit parameters if the circuit is parameterized
     """
+    # extra="ignore" skips the unknown-field walk during validation; the
+    # model stays mutable because the handler fills in default circuits
+    model_config = ConfigDict(extra="ignore")
+
     circuit_file: Optional[str] = Field(None, description="OpenQASM circuit file content")
-    shots: int = Field(1024, description="Number of execution shots")
+    shots: int = Field(1024, ge=1, description="Number of execution shots")
     backend_type: BackendType = Field(..., description="Backend type (simulator or hardware)")
     backend_provider: str = Field(..., description="Provider name")
     backend_name: Optional[str] = Field(None, description="Specific backend name if applicable")
     async_mode: bool = Field(False, description="Flag for asynchronous execution")
     parameters: Optional[Dict[str, Any]] = Field(None, description="Circuit parameters")
 
+    @field_validator("circuit_file")
+    @classmethod
+    def _circuit_file_nonempty(cls, value: Optional[str]) -> Optional[str]:
+        """Reject empty circuit content at validation time.
+
+        An empty string would otherwise travel all the way into a QASM
+        parser before failing; None stays allowed because the handler
+        substitutes a default circuit for it.
+        """
+        if value is not None and not value.strip():
+            raise ValueError("circuit_file must be non-empty")
+        return value
+
 
 class JobMetadata(BaseModel):
     """
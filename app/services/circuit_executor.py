@@ -3,373 +3,577 @@ Circuit execution service.
 
 This module provides functions for executing quantum circuits on various backends.
 """
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Dict, Any, Final, Optional, List, Tuple
 import asyncio
+import importlib.util
+import os
+import threading
 import time
+from collections import Counter, OrderedDict
 from pathlib import Path
 from app.core.logging import get_logger
 
-# Import quantum backends with availability checking
-try:
-    from qiskit import QuantumCircuit
-    from qiskit_aer import AerSimulator
-    QISKIT_AVAILABLE = True
-except ImportError:
-    QISKIT_AVAILABLE = False
-
-try:
-    import cirq
-    from cirq.contrib.qasm_import import circuit_from_qasm
-    CIRQ_AVAILABLE = True
-except ImportError:
-    CIRQ_AVAILABLE = False
-
-try:
-    from braket.devices import LocalSimulator
-    from braket.circuits import Circuit as BraketCircuit
-    from qiskit import QuantumCircuit
-    from qiskit.qasm2.exceptions import QASM2ParseError
-    from qiskit_braket_provider.providers.adapter import convert_qiskit_to_braket_circuit
-    BRAKET_AVAILABLE = True
-except ImportError:
-    BRAKET_AVAILABLE = False
-
-# Import backend simulation functions
-from app.services.simulation_backends.qiskit_backend import run_qiskit_simulation
-from app.services.simulation_backends.cirq_backend import run_cirq_simulation
-from app.services.simulation_backends.braket_backend import run_braket_simulation
-
-# Import hardware runner functions
-from app.services.hardware_runners.ibm_hardware_runner import run_on_ibm_hardware
-from app.services.hardware_runners.aws_hardware_runner import run_on_aws_hardware
-from app.services.hardware_runners.google_hardware_runner import run_on_google_hardware
+# Probe quantum SDK availability without importing them: find_spec only
+# walks sys.path, so importing this module no longer pays the 1-2s
+# qiskit/cirq/braket initialization for providers the caller never uses.
+# The SDKs themselves are imported lazily by the backend/runner modules.
+def _sdk_available(*module_names: str) -> bool:
+    """Return True if every named top-level module can be found."""
+    try:
+        return all(
+            importlib.util.find_spec(name) is not None for name in module_names
+        )
+    except (ImportError, ValueError):
+        return False
+
+
+# Final: availability is fixed for the process lifetime once probed, and
+# the backend tables below bake the values in at import time
+QISKIT_AVAILABLE: Final[bool] = _sdk_available("qiskit", "qiskit_aer")
+CIRQ_AVAILABLE: Final[bool] = _sdk_available("cirq")
+BRAKET_AVAILABLE: Final[bool] = _sdk_available("braket", "qiskit", "qiskit_braket_provider")
 
 logger = get_logger(__name__)
 
+# Availability answers cached per provider with a TTL so repeated requests
+# don't re-probe; entries map provider -> (result, expiry timestamp)
+AVAILABILITY_CACHE_TTL_SECONDS = 300.0
+_availability_cache: Dict[str, Any] = {}
+
+# Per-provider caps on in-flight hardware jobs: submitting a large burst
+# at once floods the provider queue and triggers rate-limit backoffs, so
+# each provider gets a bounded number of concurrent submissions
+HARDWARE_MAX_IN_FLIGHT = {"ibm": 4, "aws": 8, "google": 4}
+_hardware_semaphores: Dict[str, asyncio.Semaphore] = {
+    provider: asyncio.Semaphore(limit)
+    for provider, limit in HARDWARE_MAX_IN_FLIGHT.items()
+}
+
+# QASM file contents cached by path with mtime validation, so retries and
+# repeated executions of the same stored circuit touch the disk once
+QASM_CACHE_SIZE = 256
+_qasm_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+# Guards _qasm_cache: executions run on worker threads, and the
+# get/move_to_end/popitem sequence is not safe under concurrent mutation
+_qasm_cache_lock = threading.Lock()
+
+
+def _read_qasm_cached(circuit_path: str) -> Optional[str]:
+    """
+    Read a QASM file, reusing the cached content while its mtime is unchanged.
+
+    Returns None when the file cannot be read, leaving the runner to handle
+    the missing file through its normal error path.
+    """
+    try:
+        mtime = os.path.getmtime(circuit_path)
+    except OSError:
+        return None
+
+    with _qasm_cache_lock:
+        cached = _qasm_cache.get(circuit_path)
+        if cached is not None and cached[0] == mtime:
+            _qasm_cache.move_to_end(circuit_path)
+            return cached[1]
+
+    # Read outside the lock so disk I/O never serializes cache hits; a
+    # racing duplicate read just overwrites with identical content
+    try:
+        with open(circuit_path, "r") as f:
+            content = f.read()
+    except OSError:
+        return None
+
+    with _qasm_cache_lock:
+        _qasm_cache[circuit_path] = (mtime, content)
+        while len(_qasm_cache) > QASM_CACHE_SIZE:
+            _qasm_cache.popitem(last=False)
+    return content
+
 
 def check_provider_availability(provider: str) -> bool:
     """
     Check if the specified provider is available.
-    
+
+    Results are cached for AVAILABILITY_CACHE_TTL_SECONDS since provider
+    availability rarely changes within a process lifetime.
+
     Args:
         provider: The name of the provider to check
-        
+
     Returns:
         True if the provider is available, False otherwise
     """
-    if provider == "qiskit":
-        return QISKIT_AVAILABLE
-    elif provider == "cirq":
-        return CIRQ_AVAILABLE
-    elif provider == "braket":
-        return BRAKET_AVAILABLE
-    elif provider in ["aws", "ibm", "google"]:
-        # For hardware providers, we would check credentials and connectivity
-        # This is a placeholder for future implementation
-        return True
+    cached = _availability_cache.get(provider)
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+
+    available = _check_provider_availability(provider)
+    _availability_cache[provider] = (available, time.monotonic() + AVAILABILITY_CACHE_TTL_SECONDS)
+    return available
+
+
+# Provider availability resolved once at import; hardware providers are
+# assumed reachable until credential/connectivity checks are implemented
+_PROVIDER_AVAILABILITY = {
+    "qiskit": QISKIT_AVAILABLE,
+    "cirq": CIRQ_AVAILABLE,
+    "braket": BRAKET_AVAILABLE,
+    "aws": True,
+    "ibm": True,
+    "google": True,
+}
+
+
+def _check_provider_availability(provider: str) -> bool:
+    """Uncached availability probe for the specified provider."""
+    return _PROVIDER_AVAILABILITY.get(provider, False)
+
+
+# Runner loaders: each defers its module (and the SDK it pulls in) to the
+# first call, after which the import is a sys.modules hit
+def _load_qiskit_runner():
+    from app.services.simulation_backends.qiskit_backend import run_qiskit_simulation
+    return run_qiskit_simulation
+
+
+def _load_cirq_runner():
+    from app.services.simulation_backends.cirq_backend import run_cirq_simulation
+    return run_cirq_simulation
+
+
+def _load_braket_runner():
+    from app.services.simulation_backends.braket_backend import run_braket_simulation
+    return run_braket_simulation
+
+
+def _load_ibm_runner():
+    from app.services.hardware_runners.ibm_hardware_runner import run_on_ibm_hardware
+    return run_on_ibm_hardware
+
+
+def _load_aws_runner():
+    from app.services.hardware_runners.aws_hardware_runner import run_on_aws_hardware
+    return run_on_aws_hardware
+
+
+def _load_google_runner():
+    from app.services.hardware_runners.google_hardware_runner import run_on_google_hardware
+    return run_on_google_hardware
+
+
+def _extract_ibm_result(result: Dict[str, Any], execution_time: float) -> Dict[str, Any]:
+    """IBM returns a full envelope; stamp the timing and pass it through."""
+    if "metadata" in result and isinstance(result["metadata"], dict):
+        result["metadata"]["execution_time"] = execution_time
+    return result
+
+
+def _extract_aws_result(result: Dict[str, Any], execution_time: float) -> Counter:
+    """AWS may lack a metadata dict; stamp timing wherever it fits."""
+    if "metadata" in result:
+        result["metadata"]["execution_time"] = execution_time
     else:
-        return False
+        # In case the structure is different
+        result["execution_time"] = execution_time
+    return Counter(result.get("counts", {}))
+
+
+def _extract_google_result(result: Dict[str, Any], execution_time: float) -> Counter:
+    """Google always carries metadata; stamp timing and return the counts."""
+    result["metadata"]["execution_time"] = execution_time
+    return Counter(result["counts"])
+
+
+# Backend tables: the six public executors below are thin wrappers around
+# the two shared cores, so timing, logging, caching and error wrapping
+# live in one place per backend kind instead of being copied per provider
+_SIMULATOR_BACKENDS: Dict[str, Dict[str, Any]] = {
+    "qiskit": {
+        "label": "Qiskit",
+        "available": QISKIT_AVAILABLE,
+        "load_runner": _load_qiskit_runner,
+    },
+    "cirq": {
+        "label": "Cirq",
+        "available": CIRQ_AVAILABLE,
+        "load_runner": _load_cirq_runner,
+    },
+    "braket": {
+        "label": "Braket",
+        "available": BRAKET_AVAILABLE,
+        "load_runner": _load_braket_runner,
+    },
+}
+
+_HARDWARE_BACKENDS: Dict[str, Dict[str, Any]] = {
+    "ibm": {
+        "label": "IBM hardware",
+        "load_runner": _load_ibm_runner,
+        "defaults": {
+            "wait_for_results": True,
+            "poll_timeout_seconds": 3600,
+            "optimization_level": 1,
+            "api_token": None,
+        },
+        "extract": _extract_ibm_result,
+    },
+    "aws": {
+        "label": "AWS hardware",
+        "load_runner": _load_aws_runner,
+        "defaults": {
+            "wait_for_results": True,
+            "poll_timeout_seconds": 3600,
+            "access_key": None,
+            "secret_key": None,
+            "region": None,
+        },
+        "extract": _extract_aws_result,
+    },
+    "google": {
+        "label": "Google hardware",
+        "load_runner": _load_google_runner,
+        "defaults": {
+            "wait_for_results": True,
+            "poll_timeout_seconds": 3600,
+            "auth_file": None,
+            "project_id": None,
+        },
+        "extract": _extract_google_result,
+    },
+}
+
+
+async def _execute_simulation(
+    provider: str, circuit_path: str, parameters: Dict[str, Any], shots: int,
+    circuit_content: Optional[str] = None,
+) -> Counter:
+    """Shared core for the simulator executors."""
+    spec = _SIMULATOR_BACKENDS[provider]
+    label = spec["label"]
+    # Availability is resolved once at import time; this is a plain bool
+    # read, not a probe
+    if not spec["available"]:
+        raise ValueError(f"{label} is not available")
+
+    # Resolve content through the mtime-validated read cache when the
+    # caller didn't supply it, so repeat executions skip the disk
+    if circuit_content is None:
+        circuit_content = await asyncio.to_thread(_read_qasm_cached, circuit_path)
+
+    # Monotonic, high-resolution timing immune to wall-clock adjustments
+    start_ns = time.perf_counter_ns()
+
+    try:
+        # Fail fast on a missing file here, before the runner pays for its
+        # SDK import only to discover the same thing
+        if circuit_content is None and not os.path.isfile(circuit_path):
+            raise FileNotFoundError(f"QASM file not found: {circuit_path}")
+
+        # Call the backend implementation
+        result = await asyncio.to_thread(
+            spec["load_runner"](),
+            qasm_file=circuit_path,
+            shots=shots,
+            qasm_str=circuit_content,
+            **parameters
+        )
+
+        if result is None:
+            raise ValueError(f"{label} simulation returned no results")
+
+        # Update execution time in result
+        result["execution_time"] = (time.perf_counter_ns() - start_ns) / 1e9
+
+        # Counter is a dict subclass, so existing consumers are untouched,
+        # while aggregation across circuits gets C-speed Counter arithmetic
+        return Counter(result["counts"])
+    except Exception as e:
+        logger.error(f"Error executing circuit with {label}: {str(e)}", exc_info=True)
+        raise ValueError(f"Failed to execute circuit with {label}: {str(e)}")
+
+
+async def _execute_hardware(
+    provider: str, circuit_path: str, parameters: Dict[str, Any], shots: int,
+    device_id: str,
+) -> Dict[str, Any]:
+    """Shared core for the hardware executors."""
+    spec = _HARDWARE_BACKENDS[provider]
+    label = spec["label"]
+
+    # Reject bad optimization levels before paying for submission: the
+    # transpiler only accepts 0-3, and a bad value would otherwise surface
+    # as an opaque provider-side failure after the job was queued
+    if "optimization_level" in spec["defaults"]:
+        optimization_level = parameters.get("optimization_level", spec["defaults"]["optimization_level"])
+        if not isinstance(optimization_level, int) or not 0 <= optimization_level <= 3:
+            raise ValueError(
+                f"optimization_level must be an integer between 0 and 3, got {optimization_level!r}"
+            )
+
+    # Monotonic, high-resolution timing immune to wall-clock adjustments
+    start_ns = time.perf_counter_ns()
+
+    try:
+        # Extract the runner kwargs this provider understands in one pass,
+        # and keep only the leftovers for pass-through: forwarding the
+        # extracted keys again via **parameters was a duplicate-kwarg
+        # TypeError waiting to happen
+        defaults = spec["defaults"]
+        hw_kwargs = {
+            key: parameters.get(key, default) for key, default in defaults.items()
+        }
+        extra_kwargs = {
+            key: value for key, value in parameters.items() if key not in defaults
+        }
+
+        # Call the hardware runner, respecting the provider's in-flight cap
+        async with _hardware_semaphores[provider]:
+            result = await asyncio.to_thread(
+                spec["load_runner"](),
+                qasm_file=circuit_path,
+                device_id=device_id,
+                shots=shots,
+                **hw_kwargs,
+                **extra_kwargs
+            )
+
+        if result is None:
+            raise ValueError(f"{label} execution returned no results")
+
+        # Stamp timing and shape the result per provider
+        return spec["extract"](result, (time.perf_counter_ns() - start_ns) / 1e9)
+    except Exception as e:
+        logger.error(f"Error executing circuit on {label}: {str(e)}", exc_info=True)
+        raise ValueError(f"Failed to execute circuit on {label}: {str(e)}")
 
 
 async def execute_circuit_with_qiskit(
-    circuit_path: str, parameters: Dict[str, Any], shots: int
-) -> Dict[str, int]:
+    circuit_path: str, parameters: Dict[str, Any], shots: int,
+    circuit_content: Optional[str] = None,
+) -> Counter:
     """
     Execute a quantum circuit using Qiskit.
-    
+
     Args:
         circuit_path: Path to the OpenQASM circuit file
         parameters: Dictionary of circuit parameters
         shots: Number of execution shots
-    
+        circuit_content: QASM content to use directly, skipping the file read
+
     Returns:
         Measurement counts
-        
+
     Raises:
         ValueError: If Qiskit is not available or circuit execution fails
     """
-    if not QISKIT_AVAILABLE:
-        raise ValueError("Qiskit is not available")
-    
-    # Record start time for execution timing
-    start_time = time.time()
-    
-    try:
-        # Call the backend implementation
-        result = run_qiskit_simulation(
-            qasm_file=circuit_path,
-            shots=shots,
-            **parameters
-        )
-        
-        if result is None:
-            raise ValueError("Qiskit simulation returned no results")
-            
-        # Update execution time in result
-        execution_time = time.time() - start_time
-        result["execution_time"] = execution_time
-        
-        # Return the counts dictionary
-        return result["counts"]
-    except Exception as e:
-        logger.error(f"Error executing circuit with Qiskit: {str(e)}", exc_info=True)
-        raise ValueError(f"Failed to execute circuit with Qiskit: {str(e)}")
+    return await _execute_simulation("qiskit", circuit_path, parameters, shots, circuit_content)
 
 
 async def execute_circuit_with_cirq(
-    circuit_path: str, parameters: Dict[str, Any], shots: int
-) -> Dict[str, int]:
+    circuit_path: str, parameters: Dict[str, Any], shots: int,
+    circuit_content: Optional[str] = None,
+) -> Counter:
     """
     Execute a quantum circuit using Cirq.
-    
+
     Args:
         circuit_path: Path to the OpenQASM circuit file
         parameters: Dictionary of circuit parameters
         shots: Number of execution shots
-    
+        circuit_content: QASM content to use directly, skipping the file read
+
     Returns:
         Measurement counts
-        
+
     Raises:
         ValueError: If Cirq is not available or circuit execution fails
     """
-    if not CIRQ_AVAILABLE:
-        raise ValueError("Cirq is not available")
-        
-    # Record start time for execution timing
-    start_time = time.time()
-    
-    try:
-        # Call the backend implementation
-        result = run_cirq_simulation(
-            qasm_file=circuit_path,
-            shots=shots,
-            **parameters
-        )
-        
-        if result is None:
-            raise ValueError("Cirq simulation returned no results")
-            
-        # Update execution time in result
-        execution_time = time.time() - start_time
-        result["execution_time"] = execution_time
-        
-        # Return the counts dictionary
-        return result["counts"]
-    except Exception as e:
-        logger.error(f"Error executing circuit with Cirq: {str(e)}", exc_info=True)
-        raise ValueError(f"Failed to execute circuit with Cirq: {str(e)}")
+    return await _execute_simulation("cirq", circuit_path, parameters, shots, circuit_content)
 
 
 async def execute_circuit_with_braket(
-    circuit_path: str, parameters: Dict[str, Any], shots: int
-) -> Dict[str, int]:
+    circuit_path: str, parameters: Dict[str, Any], shots: int,
+    circuit_content: Optional[str] = None,
+) -> Counter:
     """
     Execute a quantum circuit using Braket.
-    
+
     Args:
         circuit_path: Path to the OpenQASM circuit file
         parameters: Dictionary of circuit parameters
         shots: Number of execution shots
-    
+        circuit_content: QASM content to use directly, skipping the file read
+
     Returns:
         Measurement counts
-        
+
     Raises:
         ValueError: If Braket is not available or circuit execution fails
     """
-    if not BRAKET_AVAILABLE:
-        raise ValueError("Braket is not available")
-        
-    # Record start time for execution timing
-    start_time = time.time()
-    
-    try:
-        # Call the backend implementation
-        result = run_braket_simulation(
-            qasm_file=circuit_path,
-            shots=shots,
-            **parameters
-        )
-        
-        if result is None:
-            raise ValueError("Braket simulation returned no results")
-            
-        # Update execution time in result
-        execution_time = time.time() - start_time
-        result["execution_time"] = execution_time
-        
-        # Return the counts dictionary
-        return result["counts"]
-    except Exception as e:
-        logger.error(f"Error executing circuit with Braket: {str(e)}", exc_info=True)
-        raise ValueError(f"Failed to execute circuit with Braket: {str(e)}")
+    return await _execute_simulation("braket", circuit_path, parameters, shots, circuit_content)
 
 
 async def execute_circuit_with_ibm_hardware(
     circuit_path: str, parameters: Dict[str, Any], shots: int, device_id: str
-) -> Dict[str, int]:
+) -> Dict[str, Any]:
     """
     Execute a quantum circuit on IBM Quantum hardware.
-    
+
     Args:
         circuit_path: Path to the OpenQASM circuit file
         parameters: Dictionary of circuit parameters
         shots: Number of execution shots
         device_id: IBM Quantum device name
-    
+
     Returns:
-        Measurement counts
-        
+        Full result dictionary (contains counts and metadata)
+
     Raises:
         ValueError: If IBM hardware execution fails
     """
-    # Record start time for execution timing
-    start_time = time.time()
-    
-    try:
-        # Extract additional parameters
-        wait_for_results = parameters.get("wait_for_results", True)
-        poll_timeout_seconds = parameters.get("poll_timeout_seconds", 3600)
-        optimization_level = parameters.get("optimization_level", 1)
-        api_token = parameters.get("api_token", None)
-        
-        # Call the hardware runner
-        result = run_on_ibm_hardware(
-            qasm_file=circuit_path,
-            device_id=device_id,
-            shots=shots,
-            wait_for_results=wait_for_results,
-            poll_timeout_seconds=poll_timeout_seconds,
-            optimization_level=optimization_level,
-            api_token=api_token,
-            **parameters
-        )
-        
-        if result is None:
-            raise ValueError("IBM hardware execution returned no results")
-            
-        # Update execution time in result metadata (if metadata exists)
-        execution_time = time.time() - start_time
-        if "metadata" in result and isinstance(result["metadata"], dict):
-            result["metadata"]["execution_time"] = execution_time
-        
-        # Return the full result dictionary (contains counts and metadata)
-        return result
-    except Exception as e:
-        logger.error(f"Error executing circuit on IBM hardware: {str(e)}", exc_info=True)
-        raise ValueError(f"Failed to execute circuit on IBM hardware: {str(e)}")
+    return await _execute_hardware("ibm", circuit_path, parameters, shots, device_id)
 
 
 async def execute_circuit_with_aws_hardware(
     circuit_path: str, parameters: Dict[str, Any], shots: int, device_id: str
-) -> Dict[str, int]:
+) -> Counter:
     """
     Execute a quantum circuit on AWS Braket hardware.
-    
+
     Args:
         circuit_path: Path to the OpenQASM circuit file
         parameters: Dictionary of circuit parameters
         shots: Number of execution shots
         device_id: AWS Braket device ARN or name
-    
+
     Returns:
         Measurement counts
-        
+
     Raises:
         ValueError: If AWS hardware execution fails
     """
-    # Record start time for execution timing
-    start_time = time.time()
-    
-    try:
-        # Extract additional parameters
-        wait_for_results = parameters.get("wait_for_results", True)
-        poll_timeout_seconds = parameters.get("poll_timeout_seconds", 3600)
-        access_key = parameters.get("access_key", None)
-        secret_key = parameters.get("secret_key", None)
-        region = parameters.get("region", None)
-        
-        # Call the hardware runner
-        result = run_on_aws_hardware(
-            qasm_file=circuit_path,
-            device_id=device_id,
-            shots=shots,
-            wait_for_results=wait_for_results,
-            poll_timeout_seconds=poll_timeout_seconds,
-            access_key=access_key,
-            secret_key=secret_key,
-            region=region,
-            **parameters
-        )
-        
-        if result is None:
-            raise ValueError("AWS hardware execution returned no results")
-            
-        # Update execution time in result metadata
-        execution_time = time.time() - start_time
-        if "metadata" in result:
-            result["metadata"]["execution_time"] = execution_time
-        else:
-            # In case the structure is different
-            result["execution_time"] = execution_time
-        
-        # Return the counts dictionary
-        return result.get("counts", {})
-    except Exception as e:
-        logger.error(f"Error executing circuit on AWS hardware: {str(e)}", exc_info=True)
-        raise ValueError(f"Failed to execute circuit on AWS hardware: {str(e)}")
+    return await _execute_hardware("aws", circuit_path, parameters, shots, device_id)
 
 
 async def execute_circuit_with_google_hardware(
     circuit_path: str, parameters: Dict[str, Any], shots: int, device_id: str
-) -> Dict[str, int]:
+) -> Counter:
     """
     Execute a quantum circuit on Google Quantum hardware.
-    
+
     Args:
         circuit_path: Path to the OpenQASM circuit file
         parameters: Dictionary of circuit parameters
         shots: Number of execution shots
         device_id: Google Quantum device name
-    
+
     Returns:
         Measurement counts
-        
+
     Raises:
         ValueError: If Google hardware execution fails
     """
-    # Record start time for execution timing
-    start_time = time.time()
-    
+    return await _execute_hardware("google", circuit_path, parameters, shots, device_id)
+
+
+async def execute_circuits_with_qiskit(
+    circuit_paths: List[str], parameters: Dict[str, Any], shots: int,
+    circuit_contents: Optional[List[Optional[str]]] = None,
+) -> List[Counter]:
+    """
+    Execute several quantum circuits as one Qiskit Aer job.
+
+    Batching amortizes the simulator setup and job dispatch over the whole
+    list, which beats per-circuit submission by a wide margin for small
+    circuits.
+
+    Args:
+        circuit_paths: Paths to the OpenQASM circuit files
+        parameters: Dictionary of circuit parameters
+        shots: Number of execution shots per circuit
+        circuit_contents: Per-circuit QASM content to use directly, where available
+
+    Returns:
+        Measurement counts per circuit, in input order
+
+    Raises:
+        ValueError: If Qiskit is not available or circuit execution fails
+    """
+    if not QISKIT_AVAILABLE:
+        raise ValueError("Qiskit is not available")
+
     try:
-        # Extract additional parameters
-        wait_for_results = parameters.get("wait_for_results", True)
-        poll_timeout_seconds = parameters.get("poll_timeout_seconds", 3600)
-        auth_file = parameters.get("auth_file", None)
-        project_id = parameters.get("project_id", None)
-        
-        # Call the hardware runner
-        result = run_on_google_hardware(
-            qasm_file=circuit_path,
-            device_id=device_id,
+        # Deferred import: the first call pays the SDK import cost
+        from app.services.simulation_backends.qiskit_backend import run_qiskit_simulation_batch
+        results = await asyncio.to_thread(
+            run_qiskit_simulation_batch,
+            qasm_files=circuit_paths,
             shots=shots,
-            wait_for_results=wait_for_results,
-            poll_timeout_seconds=poll_timeout_seconds,
-            auth_file=auth_file,
-            project_id=project_id,
+            qasm_strs=circuit_contents,
             **parameters
         )
-        
-        if result is None:
-            raise ValueError("Google hardware execution returned no results")
-            
-        # Update execution time in result metadata
-        execution_time = time.time() - start_time
-        result["metadata"]["execution_time"] = execution_time
-        
-        # Return the counts dictionary
-        return result["counts"]
+
+        if results is None:
+            raise ValueError("Qiskit batch simulation returned no results")
+
+        return [Counter(result["counts"]) for result in results]
     except Exception as e:
-        logger.error(f"Error executing circuit on Google hardware: {str(e)}", exc_info=True)
-        raise ValueError(f"Failed to execute circuit on Google hardware: {str(e)}")
+        logger.error(f"Error executing circuit batch with Qiskit: {str(e)}", exc_info=True)
+        raise ValueError(f"Failed to execute circuit batch with Qiskit: {str(e)}")
+
+
+async def stream_hardware_execution(
+    provider: str, circuit_path: str, parameters: Dict[str, Any], shots: int,
+    device_id: str, heartbeat_seconds: float = 5.0,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Execute a hardware job while yielding progress frames as it runs.
+
+    Long hardware jobs otherwise hold the caller for the full queue plus
+    execution time before anything is returned. This generator starts the
+    job through the shared hardware core and yields a status frame every
+    heartbeat_seconds, so consumers (SSE endpoints, expectation-value
+    accumulators) can react while the device is still working. The
+    runners return counts only once the job is terminal, so intermediate
+    frames carry status rather than partial counts; the final frame adds
+    the full result.
+
+    Args:
+        provider: Hardware provider key ("ibm", "aws" or "google")
+        circuit_path: Path to the OpenQASM circuit file
+        parameters: Dictionary of circuit parameters
+        shots: Number of execution shots
+        device_id: Provider-specific device identifier
+        heartbeat_seconds: Delay between progress frames
+
+    Yields:
+        {"status": "running", "elapsed": seconds} while the job runs,
+        then {"status": "completed", "result": ...} or
+        {"status": "failed", "error": ...} as the final frame.
+    """
+    start_ns = time.perf_counter_ns()
+    task = asyncio.ensure_future(
+        _execute_hardware(provider, circuit_path, parameters, shots, device_id)
+    )
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=heartbeat_seconds)
+            if done:
+                break
+            yield {
+                "status": "running",
+                "elapsed": (time.perf_counter_ns() - start_ns) / 1e9,
+            }
+    except BaseException:
+        # Consumer went away (client disconnect, cancellation): don't leave
+        # the hardware call running unobserved
+        task.cancel()
+        raise
+
+    try:
+        result = task.result()
+    except ValueError as e:
+        yield {"status": "failed", "error": str(e)}
+        return
+    yield {"status": "completed", "result": result}
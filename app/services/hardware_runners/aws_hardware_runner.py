@@ -11,10 +11,17 @@ from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Status polling backs off exponentially between these bounds so fast tasks
+# are picked up quickly without hammering the Braket API on long queues
+POLL_INTERVAL_FLOOR_SECONDS = 1.0
+POLL_INTERVAL_CAP_SECONDS = 10.0
+POLL_BACKOFF_FACTOR = 1.5
+
 def run_on_aws_hardware(qasm_file: str, device_id: str = None, shots: int = 1000,
                       wait_for_results: bool = True, poll_timeout_seconds: int = 3600,
                       access_key: Optional[str] = None, secret_key: Optional[str] = None,
-                      region: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+                      region: Optional[str] = None,
+                      poll_interval_floor: float = POLL_INTERVAL_FLOOR_SECONDS, **kwargs) -> Dict[str, Any]:
     """
     Run a QASM file on AWS Braket hardware.
     
@@ -27,6 +34,7 @@ def run_on_aws_hardware(qasm_file: str, device_id: str = None, shots: int = 1000
         access_key: AWS access key (optional)
         secret_key: AWS secret key (optional)
         region: AWS region (optional)
+        poll_interval_floor: Initial delay between status polls, in seconds
         **kwargs: Additional arguments
         
     Returns:
@@ -146,17 +154,19 @@ def run_on_aws_hardware(qasm_file: str, device_id: str = None, shots: int = 1000
             if wait_for_results:
                 logger.info(f"Waiting for task to complete (timeout: {poll_timeout_seconds}s)...")
                 start_time = time.time()
-                
-                # Poll until task completes or timeout
+                poll_interval = poll_interval_floor
+
+                # Poll until task completes or timeout, backing off between polls
                 while time.time() - start_time < poll_timeout_seconds:
                     task_status = task.state()
                     logger.info(f"Current status: {task_status}")
-                    
+
                     if task_status in ['COMPLETED', 'FAILED', 'CANCELLED']:
                         break
-                    
-                    time.sleep(10)  # Sleep for 10 seconds between polls
-                
+
+                    time.sleep(poll_interval)
+                    poll_interval = min(poll_interval * POLL_BACKOFF_FACTOR, POLL_INTERVAL_CAP_SECONDS)
+
                 # Check if task completed successfully
                 if task.state() == 'COMPLETED':
                     logger.info("Task completed successfully!")
@@ -261,16 +271,18 @@ def run_on_aws_hardware(qasm_file: str, device_id: str = None, shots: int = 1000
                 if wait_for_results:
                     logger.info(f"Waiting for task to complete (timeout: {poll_timeout_seconds}s)...")
                     start_time = time.time()
-                    
-                    # Poll until task completes or timeout
+                    poll_interval = poll_interval_floor
+
+                    # Poll until task completes or timeout, backing off between polls
                     while time.time() - start_time < poll_timeout_seconds:
                         task_status = task.state()
                         logger.info(f"Current status: {task_status}")
-                        
+
                         if task_status in ['COMPLETED', 'FAILED', 'CANCELLED']:
                             break
-                        
-                        time.sleep(10)  # Sleep for 10 seconds between polls
+
+                        time.sleep(poll_interval)
+                        poll_interval = min(poll_interval * POLL_BACKOFF_FACTOR, POLL_INTERVAL_CAP_SECONDS)
                     
                     # Check if task completed successfully
                     if task.state() == 'COMPLETED':
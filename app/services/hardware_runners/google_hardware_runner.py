@@ -11,10 +11,17 @@ from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
-def run_on_google_hardware(qasm_file: str, device_id: str = 'rainbow', 
+# Status polling backs off exponentially between these bounds so fast jobs
+# are picked up quickly without hammering the Quantum Engine API
+POLL_INTERVAL_FLOOR_SECONDS = 1.0
+POLL_INTERVAL_CAP_SECONDS = 30.0
+POLL_BACKOFF_FACTOR = 1.5
+
+def run_on_google_hardware(qasm_file: str, device_id: str = 'rainbow',
                            shots: int = 1000, wait_for_results: bool = True,
-                           poll_timeout_seconds: int = 3600, auth_file: Optional[str] = None, 
-                           project_id: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+                           poll_timeout_seconds: int = 3600, auth_file: Optional[str] = None,
+                           project_id: Optional[str] = None,
+                           poll_interval_floor: float = POLL_INTERVAL_FLOOR_SECONDS, **kwargs) -> Dict[str, Any]:
     """
     Run a QASM file on Google Quantum hardware.
     
@@ -26,6 +33,7 @@ def run_on_google_hardware(qasm_file: str, device_id: str = 'rainbow',
         poll_timeout_seconds: Maximum time to wait for results, in seconds
         auth_file: Path to Google authentication file (optional)
         project_id: Google Cloud project ID (optional)
+        poll_interval_floor: Initial delay between status polls, in seconds
         **kwargs: Additional arguments
         
     Returns:
@@ -273,17 +281,19 @@ def run_on_google_hardware(qasm_file: str, device_id: str = 'rainbow',
                 if wait_for_results:
                     logger.info(f"Waiting for job to complete (timeout: {poll_timeout_seconds}s)...")
                     start_time = time.time()
-                    
-                    # Poll until job completes or timeout
+                    poll_interval = poll_interval_floor
+
+                    # Poll until job completes or timeout, backing off between polls
                     while time.time() - start_time < poll_timeout_seconds:
                         # Check job status
                         status = job.status()
                         logger.info(f"Current status: {status}")
-                        
+
                         if status in ['READY', 'SUCCESS', 'FAILURE', 'CANCELLED']:
                             break
-                        
-                        time.sleep(30)  # Sleep for 30 seconds between polls
+
+                        time.sleep(poll_interval)
+                        poll_interval = min(poll_interval * POLL_BACKOFF_FACTOR, POLL_INTERVAL_CAP_SECONDS)
                     
                     # Check if job completed successfully
                     if job.status() == 'SUCCESS':
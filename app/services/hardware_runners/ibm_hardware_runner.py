@@ -2,21 +2,417 @@
 IBM Quantum Hardware Runner for executing quantum circuits on IBM Quantum hardware.
 """
 
+import hashlib
+import importlib.util
 import os
+import pickle
 import time
-import tempfile
 import json
 import logging
-from typing import Dict, Any, Optional
-
-# Import JobStatus here
-from qiskit.providers.jobstatus import JobStatus
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Package availability resolved once at import via find_spec, so the
+# functions below check a module flag instead of running try/except
+# ImportError ladders per call. The SDK imports themselves stay inside the
+# functions: after the first call they are sys.modules hits, and keeping
+# them out of module scope keeps cold imports of this module cheap.
+_QISKIT_OK = importlib.util.find_spec("qiskit") is not None
+_RUNTIME_OK = importlib.util.find_spec("qiskit_ibm_runtime") is not None
+_PROVIDER_OK = importlib.util.find_spec("qiskit_ibm_provider") is not None
+
+# Whether the installed qiskit-ibm-runtime exposes SamplerV2; resolved on
+# first use (find_spec cannot see class-level availability) and cached so
+# the submission path dispatches on a flag instead of exception handling
+_SAMPLER_V2_AVAILABLE: Optional[bool] = None
+
+
+def _sampler_v2_available() -> bool:
+    """Return True when qiskit_ibm_runtime provides SamplerV2."""
+    global _SAMPLER_V2_AVAILABLE
+    if _SAMPLER_V2_AVAILABLE is None:
+        try:
+            from qiskit_ibm_runtime import SamplerV2  # noqa: F401
+            _SAMPLER_V2_AVAILABLE = True
+        except ImportError:
+            _SAMPLER_V2_AVAILABLE = False
+    return _SAMPLER_V2_AVAILABLE
+
+# Status polling backs off exponentially between these bounds so fast jobs
+# are picked up quickly without hammering the IBM API on long queues
+POLL_INTERVAL_FLOOR_SECONDS = 1.0
+POLL_INTERVAL_CAP_SECONDS = 30.0
+POLL_BACKOFF_FACTOR = 1.5
+
+# Terminal job states by name, covering both the Runtime API (plain
+# strings) and the legacy provider API (JobStatus enum members)
+_TERMINAL_STATUS_NAMES = frozenset({"DONE", "ERROR", "CANCELLED"})
+
+
+def _is_terminal(job_status) -> bool:
+    """Return True when a job status (enum or string) is terminal."""
+    name = getattr(job_status, 'name', None) or str(job_status)
+    return name.upper() in _TERMINAL_STATUS_NAMES
+
+
+def _is_done(job_status) -> bool:
+    """Return True when a job status (enum or string) reports DONE."""
+    name = getattr(job_status, 'name', None) or str(job_status)
+    return name.upper() == "DONE"
+
+
+def _counts_to_soa(counts: Dict[str, int]):
+    """
+    Convert a {bitstring: count} dict to packed numpy arrays.
+
+    Returns (keys, values): int64 bitstring values and int32 counts in
+    matching order. For wide circuits this is 10-20x smaller than the
+    dict of Python strings and lets downstream histogram/probability
+    math vectorize instead of iterating dict items.
+    """
+    import numpy as np
+    keys = np.fromiter(
+        (int(key.replace(' ', ''), 2) for key in counts),
+        dtype=np.int64, count=len(counts),
+    )
+    values = np.fromiter(counts.values(), dtype=np.int32, count=len(counts))
+    return keys, values
+
+# Transpiled circuits cached on disk keyed by (QASM hash, backend,
+# optimization level, backend calibration date): transpilation dominates
+# classical time for larger circuits, and the calibration date in the key
+# invalidates entries automatically when the device is recalibrated
+TRANSPILE_CACHE_DIR = Path(os.path.expanduser("~/.cache/microservice/ibm_transpile"))
+
+
+# Calibration dates cached briefly per device: device.properties() can hit
+# the network, and the transpile cache consults it once per lookup and once
+# per store for every circuit in a batch
+PROPERTIES_CACHE_TTL_SECONDS = 60.0
+_properties_cache: Dict[str, Any] = {}
+
+
+def _device_calibration(device) -> str:
+    """Return the device's calibration date string, cached for a short TTL."""
+    device_name = getattr(device, 'name', None) or str(device)
+    now = time.monotonic()
+    cached = _properties_cache.get(device_name)
+    if cached is not None and now - cached[1] < PROPERTIES_CACHE_TTL_SECONDS:
+        return cached[0]
+
+    try:
+        calibration = str(device.properties().last_update_date)
+    except Exception:
+        calibration = "unknown"
+    _properties_cache[device_name] = (calibration, now)
+    return calibration
+
+
+def _transpile_cache_path(qasm_str: str, device, optimization_level: int) -> Path:
+    """Build the cache file path for one (circuit, device, level) combination."""
+    calibration = _device_calibration(device)
+    digest = hashlib.sha256(
+        f"{qasm_str}\x00{calibration}".encode()
+    ).hexdigest()
+    device_name = getattr(device, 'name', None) or str(device)
+    return TRANSPILE_CACHE_DIR / f"{digest}_{device_name}_L{optimization_level}.pkl"
+
+
+def _transpile_cache_get(qasm_str: str, device, optimization_level: int):
+    """Return the cached transpiled circuit, or None on a miss."""
+    cache_path = _transpile_cache_path(qasm_str, device, optimization_level)
+    try:
+        if cache_path.is_file():
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+    except Exception as e:
+        logger.warning(f"Failed to load cached transpiled circuit: {e}")
+    return None
+
+
+def _transpile_cache_put(qasm_str: str, device, optimization_level: int, transpiled) -> None:
+    """Store a transpiled circuit; cache failures are logged, never raised."""
+    cache_path = _transpile_cache_path(qasm_str, device, optimization_level)
+    try:
+        TRANSPILE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(transpiled, f)
+    except Exception as e:
+        logger.warning(f"Failed to cache transpiled circuit: {e}")
+
+
+# Preset pass managers cached per (backend name, optimization level):
+# transpile() rebuilds the whole StagedPassManager from the backend target
+# on every call, which is a material fraction of the transpile cost for
+# small circuits submitted against the same device repeatedly
+_pass_manager_cache: Dict[Any, Any] = {}
+
+
+def _get_pass_manager(device, optimization_level: int):
+    """Build or reuse the preset pass manager for one device and level."""
+    device_name = getattr(device, 'name', None) or str(device)
+    key = (device_name, optimization_level)
+    pm = _pass_manager_cache.get(key)
+    if pm is None:
+        from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
+        pm = generate_preset_pass_manager(optimization_level=optimization_level,
+                                          backend=device)
+        _pass_manager_cache[key] = pm
+    return pm
+
+
+def _transpile_cached(circuit, qasm_str: str, device, optimization_level: int):
+    """Transpile a circuit for a device, reusing the on-disk cache when valid."""
+    transpiled = _transpile_cache_get(qasm_str, device, optimization_level)
+    if transpiled is not None:
+        logger.info("Using cached transpiled circuit")
+        return transpiled
+
+    try:
+        transpiled = _get_pass_manager(device, optimization_level).run(circuit)
+    except Exception as e:
+        # Some backends (notably legacy BackendV1 objects) cannot seed the
+        # preset pipeline; fall back to the one-shot transpile() for those
+        logger.warning(f"Preset pass manager unavailable ({e}); using transpile()")
+        from qiskit import transpile
+        transpiled = transpile(circuit, backend=device, optimization_level=optimization_level)
+    _transpile_cache_put(qasm_str, device, optimization_level, transpiled)
+    return transpiled
+
+# Service handles and backend listings are cached across invocations:
+# constructing QiskitRuntimeService and calling backends() each round-trip
+# to IBM Cloud, which is pure overhead for batch workloads that call the
+# runner repeatedly. Entries are (value, timestamp) keyed by token.
+SERVICE_CACHE_TTL_SECONDS = 300.0
+BACKENDS_CACHE_TTL_SECONDS = 60.0
+_service_cache: Dict[str, Any] = {}
+_backends_cache: Dict[str, Any] = {}
+_cache_lock = threading.Lock()
+
+
+def _get_runtime_service(ibm_api_token: str):
+    """Construct or reuse a QiskitRuntimeService for the given token."""
+    from qiskit_ibm_runtime import QiskitRuntimeService
+
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _service_cache.get(ibm_api_token)
+        if cached is not None and now - cached[1] < SERVICE_CACHE_TTL_SECONDS:
+            return cached[0]
+
+    if ibm_api_token == "USING_SAVED_ACCOUNT":
+        service = QiskitRuntimeService()
+    else:
+        service = QiskitRuntimeService(channel="ibm_quantum", token=ibm_api_token)
+
+    with _cache_lock:
+        _service_cache[ibm_api_token] = (service, now)
+    return service
+
+
+def _get_hardware_backends(service, ibm_api_token: str,
+                           ttl_seconds: Optional[float] = None):
+    """Return operational hardware backends, cached for a short TTL."""
+    if ttl_seconds is None:
+        ttl_seconds = BACKENDS_CACHE_TTL_SECONDS
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _backends_cache.get(ibm_api_token)
+        if cached is not None and now - cached[1] < ttl_seconds:
+            return cached[0]
+
+    backends = service.backends(operational=True, simulator=False)
+    with _cache_lock:
+        _backends_cache[ibm_api_token] = (backends, now)
+    return backends
+
+
+# Submitted jobs persisted to disk: with wait_for_results=True the running
+# process owns the only handle, so a restart used to orphan jobs that keep
+# running (and billing) on IBM's side. A startup task or external poller
+# can scan these records and re-attach via retrieve_ibm_result.
+PENDING_JOBS_DIR = Path(os.path.expanduser("~/.cache/microservice/pending_jobs"))
+COMPLETED_JOBS_DIR = PENDING_JOBS_DIR / "completed"
+
+
+def _record_pending_job(job_id: str, backend_name: str, shots: int, api_kind: str,
+                        creg_name: Optional[str] = None) -> None:
+    """Persist a submitted job's identity; failures are logged, never raised."""
+    try:
+        PENDING_JOBS_DIR.mkdir(parents=True, exist_ok=True)
+        record = {
+            'job_id': job_id,
+            'backend_name': backend_name,
+            'creg_name': creg_name,
+            'shots': shots,
+            'submitted_at': time.time(),
+            'api_kind': api_kind,
+        }
+        with open(PENDING_JOBS_DIR / f"{job_id}.json", 'w') as f:
+            json.dump(record, f)
+    except Exception as e:
+        logger.warning(f"Failed to persist pending job {job_id}: {e}")
+
+
+def _mark_job_complete(job_id: str) -> None:
+    """Move a job's pending record to completed/; failures are logged."""
+    try:
+        pending_path = PENDING_JOBS_DIR / f"{job_id}.json"
+        if pending_path.is_file():
+            COMPLETED_JOBS_DIR.mkdir(parents=True, exist_ok=True)
+            pending_path.rename(COMPLETED_JOBS_DIR / pending_path.name)
+    except Exception as e:
+        logger.warning(f"Failed to mark job {job_id} complete: {e}")
+
+
+def list_pending_jobs() -> List[Dict[str, Any]]:
+    """Return persisted records of jobs submitted but not yet collected."""
+    records = []
+    try:
+        for path in sorted(PENDING_JOBS_DIR.glob("*.json")):
+            try:
+                with open(path) as f:
+                    records.append(json.load(f))
+            except Exception as e:
+                logger.warning(f"Skipping unreadable pending-job record {path.name}: {e}")
+    except Exception as e:
+        logger.warning(f"Failed to scan pending jobs: {e}")
+    return records
+
+
+def _device_coupling_edges(device) -> Optional[set]:
+    """Return the device's directed coupling edges as a set, or None if unknown."""
+    try:
+        coupling_map = getattr(device, 'coupling_map', None)
+        if coupling_map is None:
+            coupling_map = device.configuration().coupling_map
+        if coupling_map is None:
+            return None
+        edges = coupling_map.get_edges() if hasattr(coupling_map, 'get_edges') else coupling_map
+        return {tuple(edge) for edge in edges}
+    except Exception:
+        return None
+
+
+def _in_device_basis(circuit, device) -> bool:
+    """
+    Return True when the circuit already fits the device untranspiled.
+
+    Checks that every gate is in the device's basis set (plus measure,
+    barrier and reset, which need no translation), that the circuit is no
+    wider than the device, and that every two-qubit gate sits on a
+    coupling-map edge (in either direction, since the transpiler can flip
+    a CX for free compared to routing it).
+    """
+    try:
+        try:
+            basis = set(device.configuration().basis_gates)
+            n_qubits = device.configuration().n_qubits
+        except AttributeError:
+            # BackendV2 exposes these directly
+            basis = set(device.operation_names)
+            n_qubits = device.num_qubits
+        gate_names = {instruction.operation.name for instruction in circuit.data}
+        if not (gate_names <= basis | {'measure', 'barrier', 'reset'}
+                and circuit.num_qubits <= n_qubits):
+            return False
+
+        edges = _device_coupling_edges(device)
+        if edges is not None:
+            for instruction in circuit.data:
+                if instruction.operation.name == 'barrier' or len(instruction.qubits) < 2:
+                    continue
+                indices = tuple(circuit.find_bit(qubit).index for qubit in instruction.qubits)
+                if len(indices) == 2 and indices not in edges and indices[::-1] not in edges:
+                    return False
+        return True
+    except Exception as e:
+        logger.warning(f"Could not check device basis ({e}); transpiling normally")
+        return False
+
+
+def _prepare_circuit(circuit, qasm_str: str, device, optimization_level: int,
+                     skip_if_in_basis: bool, assume_native: bool = False):
+    """
+    Transpile a circuit for a device, or pass it through untouched.
+
+    At optimization level 0 the transpiler performs no optimization, so a
+    circuit that is already in the device basis (e.g. shipped by an
+    upstream compiler) gains nothing from the layout/routing passes and
+    can skip the transpile call entirely. assume_native extends the skip
+    to any optimization level, for callers submitting hand-tuned QASM;
+    the basis/coupling check still runs, so an incompatible circuit falls
+    back to a normal transpile rather than a hardware rejection.
+    """
+    if ((assume_native or (skip_if_in_basis and optimization_level == 0))
+            and _in_device_basis(circuit, device)):
+        logger.info("Circuit already matches device basis; skipping transpile")
+        return circuit
+    return _transpile_cached(circuit, qasm_str, device, optimization_level)
+
+
+def _error_result(device_id, error_msg: str, **extra) -> Dict[str, Any]:
+    """Build the runner's standard error envelope."""
+    return {"counts": {"error": 1}, "metadata": {
+        'platform': 'ibm',
+        'device_id': device_id,
+        'error': error_msg,
+        **extra,
+    }}
+
+
+def _device_num_qubits(device) -> Optional[int]:
+    """Return the device's qubit count, or None if it cannot be determined."""
+    n_qubits = getattr(device, 'num_qubits', None)
+    if n_qubits is None:
+        try:
+            n_qubits = device.configuration().n_qubits
+        except Exception:
+            return None
+    return n_qubits
+
+
+def _estimated_queue_seconds(job) -> Optional[float]:
+    """Best-effort seconds until estimated job completion, or None."""
+    try:
+        queue_info = job.queue_info() if hasattr(job, 'queue_info') else None
+        estimated = getattr(queue_info, 'estimated_complete_time', None)
+        if estimated is not None:
+            from datetime import datetime, timezone
+            return max(0.0, (estimated - datetime.now(timezone.utc)).total_seconds())
+    except Exception as e:
+        logger.debug("Could not read queue info: %s", e)
+    return None
+
+
+def _least_busy(service, backends):
+    """
+    Pick the least-busy backend, preferring a single server-side query.
+
+    The old min() over b.status().pending_jobs issued one HTTP round-trip
+    per backend sequentially; service.least_busy answers in one RPC, and
+    the fallback fetches the statuses concurrently instead of serially.
+    """
+    try:
+        return service.least_busy(operational=True, simulator=False)
+    except Exception as e:
+        logger.warning(f"least_busy query failed ({e}); fetching backend statuses concurrently")
+    with ThreadPoolExecutor(max_workers=min(16, len(backends))) as pool:
+        pending = list(pool.map(lambda b: (b, b.status().pending_jobs), backends))
+    return min(pending, key=lambda p: p[1])[0]
+
+
 def run_on_ibm_hardware(qasm_file: str, device_id: str = None, shots: int = 1024,
                       wait_for_results: bool = True, poll_timeout_seconds: int = 3600,
-                      optimization_level: int = 1, api_token: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+                      optimization_level: int = 1, api_token: Optional[str] = None,
+                      poll_interval_floor: float = POLL_INTERVAL_FLOOR_SECONDS,
+                      skip_transpile_if_in_basis: bool = True,
+                      counts_format: str = "dict", **kwargs) -> Dict[str, Any]:
     """
     Run a QASM file on IBM Quantum hardware.
     
@@ -28,7 +424,14 @@ def run_on_ibm_hardware(qasm_file: str, device_id: str = None, shots: int = 1024
         poll_timeout_seconds: Maximum time to wait for results, in seconds
         optimization_level: Transpiler optimization level (0-3)
         api_token: IBM Quantum API token (optional)
-        **kwargs: Additional arguments
+        poll_interval_floor: Initial delay between status polls, in seconds
+        skip_transpile_if_in_basis: Skip transpilation at optimization level 0
+            when the circuit already matches the device basis
+        counts_format: "dict" (default) for {bitstring: count}, or "soa"
+            to also return packed numpy key/value arrays for aggregation
+        **kwargs: Additional arguments; assume_native=True skips
+            transpilation at any optimization level when the circuit
+            already matches the device basis and coupling map
         
     Returns:
         Dict[str, Any]: Dictionary containing counts and metadata
@@ -41,16 +444,11 @@ def run_on_ibm_hardware(qasm_file: str, device_id: str = None, shots: int = 1024
     }
     
     try:
-        # Try to import Qiskit - if not available, this will fail early
-        try:
-            from qiskit import QuantumCircuit
-        except ImportError:
+        # Fail early when Qiskit is missing; the flag was resolved at import
+        if not _QISKIT_OK:
             logger.error("Qiskit not installed. Please install qiskit to use IBM hardware.")
-            return {"counts": {"error": 1}, "metadata": {
-                'platform': 'ibm',
-                'device_id': device_id,
-                'error': "Qiskit not installed. Please install qiskit to use IBM hardware."
-            }}
+            return _error_result(device_id, "Qiskit not installed. Please install qiskit to use IBM hardware.")
+        from qiskit import QuantumCircuit
         
         # Get IBM credentials - either from config or from args
         ibm_api_token = None
@@ -70,7 +468,7 @@ def run_on_ibm_hardware(qasm_file: str, device_id: str = None, shots: int = 1024
                     break
         
         # Try to get from Qiskit saved credentials
-        if not ibm_api_token:
+        if not ibm_api_token and _PROVIDER_OK:
             try:
                 from qiskit_ibm_provider import IBMProvider
                 # This uses credentials saved via IBMProvider.save_account()
@@ -83,48 +481,36 @@ def run_on_ibm_hardware(qasm_file: str, device_id: str = None, shots: int = 1024
         if not ibm_api_token:
             error_msg = "IBM Quantum API token not found. Please provide it using --api-token or set it as an environment variable (QISKIT_IBM_TOKEN, IBM_QUANTUM_TOKEN)."
             logger.error(error_msg)
-            return {"counts": {"error": 1}, "metadata": {
-                'platform': 'ibm',
-                'device_id': device_id,
-                'error': error_msg
-            }}
-        
-        # Read QASM file
-        with open(qasm_file, 'r') as f:
-            qasm_str = f.read()
+            return _error_result(device_id, error_msg)
         
-        # Load the QASM into a Qiskit circuit
-        temp_file = tempfile.NamedTemporaryFile(suffix='.qasm', delete=False).name
-        with open(temp_file, 'w') as f:
-            f.write(qasm_str)
+        # Read the QASM file once and parse the string directly: the old
+        # temp-file round-trip cost two extra disk I/Os per call and left a
+        # stray file behind if parsing raised
+        qasm_str = Path(qasm_file).read_text()
+        circuit = QuantumCircuit.from_qasm_str(qasm_str)
         
-        # Parse the circuit
-        circuit = QuantumCircuit.from_qasm_file(temp_file)
-        
-        try:
-            os.remove(temp_file)
-        except:
-            pass
-        
-        # Initialize IBM Quantum services based on API version
+        # Initialize IBM Quantum services based on API version. Which API
+        # is installed was probed once at import time, so the branch is
+        # decided up front: a transient Runtime error now propagates like
+        # any other submission failure instead of silently re-running the
+        # whole submission through IBMProvider and risking a duplicate,
+        # billed job.
         try:
-            try:
-                # First try with Qiskit IBM Runtime (newer API)
-                from qiskit_ibm_runtime import QiskitRuntimeService, Sampler
+            if _RUNTIME_OK:
+                # Qiskit IBM Runtime (newer API)
+                from qiskit_ibm_runtime import Sampler
                 
-                # Initialize the QiskitRuntimeService
-                if ibm_api_token == "USING_SAVED_ACCOUNT":
-                    service = QiskitRuntimeService()
-                else:
-                    service = QiskitRuntimeService(channel="ibm_quantum", token=ibm_api_token)
+                # Initialize (or reuse) the QiskitRuntimeService
+                service = _get_runtime_service(ibm_api_token)
                 
                 logger.info("Using QiskitRuntimeService API")
                 
                 if not service.active_account():
                     raise RuntimeError("IBM Quantum credentials invalid or expired")
                 
-                # Get available hardware backends
-                backends = service.backends(operational=True, simulator=False)
+                # Get available hardware backends (cached for a short TTL)
+                backends = _get_hardware_backends(service, ibm_api_token,
+                                                  kwargs.get('backend_cache_ttl'))
                 if not backends:
                     raise RuntimeError("No IBM Quantum devices available")
                 
@@ -137,39 +523,39 @@ def run_on_ibm_hardware(qasm_file: str, device_id: str = None, shots: int = 1024
                         logger.warning(f"Specified device {device_id} not found or not available")
                     
                     # Get least busy device
-                    device = min(backends, key=lambda b: b.status().pending_jobs)
+                    device = _least_busy(service, backends)
                     logger.info(f"Using least busy device: {device.name}")
                 
                 # Print device info
                 logger.info(f"Device: {device.name}, Qubits: {device.num_qubits}")
                 
+                # Reject circuits wider than the device before paying for
+                # transpile (seconds) or the provider queue (minutes-hours)
+                n_qubits = _device_num_qubits(device)
+                if n_qubits is not None and circuit.num_qubits > n_qubits:
+                    error_msg = (f"Circuit needs {circuit.num_qubits} qubits but device "
+                                 f"{device.name} has {n_qubits}")
+                    logger.error(error_msg)
+                    return _error_result(device_id, error_msg)
+                
                 # Transpile circuit for the target device
-                from qiskit import transpile
-                transpiled = transpile(circuit, backend=device, optimization_level=optimization_level)
+                transpiled = _prepare_circuit(circuit, qasm_str, device, optimization_level,
+                                              skip_transpile_if_in_basis,
+                                              kwargs.get('assume_native', False))
                 
                 # Submit the job using Runtime API
                 logger.info(f"Submitting job to {device.name} using Runtime API")
                 
-                # Try different Sampler initialization approaches
-                try:
-                    # First try SamplerV2 (newer API)
+                # Dispatch on the cached SamplerV2 availability flag: the
+                # old try/except (ImportError, Exception) ladder paid for
+                # exception handling on every call and silently swallowed
+                # genuine submission errors into the V1 fallback
+                if _sampler_v2_available():
                     from qiskit_ibm_runtime import SamplerV2
-                    logger.info("Attempting to initialize SamplerV2")
-                    
-                    # Set options for shots
-                    options = {"default_shots": shots}
-                    
-                    # Initialize SamplerV2
-                    sampler = SamplerV2(mode=device, options=options)
-                    
-                    # Submit job
+                    sampler = SamplerV2(mode=device, options={"default_shots": shots})
                     job = sampler.run([transpiled])
                     logger.info("Successfully submitted job using SamplerV2")
-                except (ImportError, Exception) as e:
-                    logger.warning(f"Error with SamplerV2 initialization: {str(e)}")
-                    
-                    # Fall back to regular Sampler
-                    logger.info("Falling back to regular Sampler")
+                else:
                     sampler = Sampler(backend=device)
                     job = sampler.run([transpiled], shots=shots)
                     logger.info("Successfully submitted job using Sampler")
@@ -179,10 +565,9 @@ def run_on_ibm_hardware(qasm_file: str, device_id: str = None, shots: int = 1024
                 logger.info(f"Job ID: {job_id}")
                 logger.info(f"Monitor at: https://quantum.ibm.com/jobs/{job_id}")
             
-            except (ImportError, Exception) as e:
-                # Fall back to IBMProvider (older API)
-                logger.warning(f"Runtime API failed: {str(e)}")
-                logger.info("Falling back to IBMProvider API")
+            elif _PROVIDER_OK:
+                # Legacy IBMProvider API
+                logger.info("qiskit-ibm-runtime not installed; using IBMProvider API")
                 
                 from qiskit_ibm_provider import IBMProvider
                 
@@ -210,9 +595,18 @@ def run_on_ibm_hardware(qasm_file: str, device_id: str = None, shots: int = 1024
                 # Print device info
                 logger.info(f"Device: {device.name}, Qubits: {device.configuration().n_qubits}")
                 
+                # Same fail-fast width check as the Runtime branch
+                n_qubits = _device_num_qubits(device)
+                if n_qubits is not None and circuit.num_qubits > n_qubits:
+                    error_msg = (f"Circuit needs {circuit.num_qubits} qubits but device "
+                                 f"{device.name} has {n_qubits}")
+                    logger.error(error_msg)
+                    return _error_result(device_id, error_msg)
+                
                 # Transpile circuit for the target device
-                from qiskit import transpile
-                transpiled = transpile(circuit, backend=device, optimization_level=optimization_level)
+                transpiled = _prepare_circuit(circuit, qasm_str, device, optimization_level,
+                                              skip_transpile_if_in_basis,
+                                              kwargs.get('assume_native', False))
                 
                 # Submit the job
                 logger.info(f"Submitting job to {device.name}")
@@ -220,6 +614,12 @@ def run_on_ibm_hardware(qasm_file: str, device_id: str = None, shots: int = 1024
                 job_id = job.job_id()
                 logger.info(f"Job ID: {job_id}")
             
+            else:
+                error_msg = ("No IBM Quantum API package installed. Install "
+                             "qiskit-ibm-runtime or qiskit-ibm-provider.")
+                logger.error(error_msg)
+                return _error_result(device_id, error_msg)
+            
             # Set up metadata
             metadata = {
                 'platform': 'ibm',
@@ -230,34 +630,76 @@ def run_on_ibm_hardware(qasm_file: str, device_id: str = None, shots: int = 1024
                 'optimization_level': optimization_level
             }
             
+            # Persist the submission before any waiting: if the process
+            # dies mid-poll, the record lets a restart re-attach via
+            # retrieve_ibm_result instead of losing the paid job
+            _record_pending_job(job_id, metadata['device'], shots,
+                                'runtime' if _RUNTIME_OK else 'provider',
+                                circuit.cregs[0].name if circuit.cregs else None)
+            
+            # Defer long waits: when the provider's completion estimate
+            # exceeds the caller's budget, hand the job id back right away
+            # so the orchestrator can re-enqueue and collect the result
+            # later via retrieve_ibm_result instead of camping on one job
+            max_queue_eta_seconds = kwargs.get('max_queue_eta_seconds')
+            if wait_for_results and max_queue_eta_seconds is not None:
+                eta_seconds = _estimated_queue_seconds(job)
+                if eta_seconds is not None and eta_seconds > max_queue_eta_seconds:
+                    logger.info(f"Estimated completion in {eta_seconds:.0f}s exceeds "
+                                f"budget of {max_queue_eta_seconds:.0f}s; deferring")
+                    return {"counts": {"pending": shots}, "metadata": {
+                        **metadata,
+                        'status': 'QUEUED',
+                        'estimated_queue_seconds': eta_seconds,
+                        'message': 'Queue estimate exceeds budget; poll with retrieve_ibm_result()'
+                    }}
+
             # Wait for results if requested
             if wait_for_results:
                 logger.info(f"Waiting for job to complete (timeout: {poll_timeout_seconds}s)...")
                 start_time = time.time()
-                
-                # Poll until job completes or timeout
-                while time.time() - start_time < poll_timeout_seconds:
-                    job_status = job.status()
-                    logger.info(f"Current status: {job_status}")
-                    
-                    # Check if job completed or failed
-                    if isinstance(job_status, str):
-                        # For newer API, status is a string
-                        if job_status in ["DONE", "ERROR", "CANCELLED"]:
-                            break
-                    else:
-                        # For older API, status is an enum
-                        if job_status in [JobStatus.DONE, JobStatus.ERROR, JobStatus.CANCELLED]:
+
+                # Prefer the Runtime's own event-driven wait: it returns as
+                # soon as the job reaches a terminal state instead of leaving
+                # up to a full poll interval of post-completion latency
+                waited = False
+                if hasattr(job, 'wait_for_final_state'):
+                    try:
+                        job.wait_for_final_state(timeout=poll_timeout_seconds)
+                        waited = True
+                    except Exception as e:
+                        logger.warning(f"wait_for_final_state failed ({e}); falling back to status polling")
+
+                last_status = None
+                if not waited:
+                    # Poll until job completes or timeout, backing off between
+                    # polls (IBMProvider jobs lack wait_for_final_state).
+                    # Tests and tight-loop callers can tune the backoff curve
+                    # through kwargs without touching the module defaults.
+                    poll_interval = kwargs.get('poll_interval_initial', poll_interval_floor)
+                    poll_interval_max = kwargs.get('poll_interval_max', POLL_INTERVAL_CAP_SECONDS)
+                    poll_backoff = kwargs.get('poll_backoff', POLL_BACKOFF_FACTOR)
+                    while time.time() - start_time < poll_timeout_seconds:
+                        job_status = job.status()
+                        logger.info(f"Current status: {job_status}")
+
+                        # Check if job completed or failed
+                        if _is_terminal(job_status):
+                            last_status = job_status
                             break
-                    
-                    time.sleep(30)  # Sleep for 30 seconds between polls
+
+                        time.sleep(poll_interval)
+                        poll_interval = min(poll_interval * poll_backoff, poll_interval_max)
                 
-                # Check if job completed successfully
-                job_final_status = job.status()
+                # Reuse the last polled status; each job.status() is an HTTP
+                # round-trip, so only the event-driven wait needs a fresh one
+                job_final_status = last_status if last_status is not None else job.status()
                 logger.info(f"Final job status check. Type: {type(job_final_status)}, Value: {job_final_status}")
                 
-                # Modify the condition to check for both enum and string "DONE"
-                if job and wait_for_results and (job_final_status == JobStatus.DONE or str(job_final_status).upper() == "DONE"):
+                # Covers both the enum and string status variants
+                if _is_terminal(job_final_status):
+                    _mark_job_complete(job_id)
+                if job and wait_for_results and _is_done(job_final_status):
                     logger.info("Job completed successfully!")
                     
                     # Process the job result
@@ -271,115 +713,18 @@ def run_on_ibm_hardware(qasm_file: str, device_id: str = None, shots: int = 1024
                     try:
                         # Get the result object
                         result = job.result()
-                        logger.info(f"Result object type: {type(result)}")
-                        logger.debug(f"Result object attributes: {dir(result)}")
-                        
-                        # Default counts from initialization - explicitly set to None
-                        result_counts = None
-                        
-                        # Check different result formats and try to extract counts
-                        # Standard Qiskit result format
-                        if hasattr(result, 'get_counts'):
-                            try:
-                                result_counts = result.get_counts(0)
-                                logger.info(f"Successfully extracted counts from get_counts()")
-                            except Exception as e:
-                                logger.warning(f"Failed to extract counts using get_counts(): {str(e)}")
-                        
-                        # Try to extract from data attribute if available
-                        elif hasattr(result, 'data'):
-                            if hasattr(result.data, 'counts'):
-                                result_counts = result.data.counts
-                                logger.info("Successfully extracted counts from data.counts")
-                        
-                        # PrimitiveResult format (IBM Qiskit Runtime)
-                        elif hasattr(result, '_pub_results') and result._pub_results:
-                            logger.info("Processing PrimitiveResult format (SamplerV2)")
-                            logger.info(f"_pub_results length: {len(result._pub_results)}")
-
-                            if len(result._pub_results) > 0:
-                                pub_result = result._pub_results[0]
-                                logger.info(f"pub_result type: {type(pub_result)}")
-                                logger.debug(f"pub_result attributes: {dir(pub_result)}")
-
-                                # Get classical register name
-                                creg_name = None
-                                if hasattr(circuit, 'cregs') and circuit.cregs:
-                                    # Assuming the first classical register is the one used for measurements
-                                    creg_name = circuit.cregs[0].name
-                                    logger.info(f"Found classical register name from circuit: {creg_name}")
-                                else:
-                                    # Fallback if no cregs found (might happen with transpiled circuits)
-                                    # We can try a common default or inspect data attributes later
-                                    logger.warning("Could not find classical register name in circuit object. Will try common names or inspect data.")
-                                    # Defaulting to 'c' as seen in test_circuit.qasm
-                                    creg_name = "c" 
-
-                                # Try to extract counts as shown in the successful debug script
-                                if hasattr(pub_result, 'data'):
-                                    logger.debug(f"pub_result.data type: {type(pub_result.data)}")
-                                    logger.debug(f"pub_result.data attributes: {dir(pub_result.data)}")
-
-                                    # Function to attempt extraction with a given register name
-                                    def attempt_extraction(reg_name):
-                                        if reg_name and hasattr(pub_result.data, reg_name):
-                                            creg_data = getattr(pub_result.data, reg_name)
-                                            logger.info(f"Attempting extraction with register name: {reg_name}")
-                                            logger.debug(f"creg_data type: {type(creg_data)}")
-                                            logger.debug(f"creg_data attributes: {dir(creg_data)}")
-
-                                            if hasattr(creg_data, 'get_counts'):
-                                                try:
-                                                    counts = creg_data.get_counts()
-                                                    logger.info(f"Counts extracted successfully using register '{reg_name}': {counts}")
-                                                    return counts
-                                                except Exception as e:
-                                                    logger.warning(f"Error calling get_counts on register '{reg_name}': {e}")
-                                            else:
-                                                logger.warning(f"Register data for '{reg_name}' has no get_counts method.")
-                                        else:
-                                            logger.debug(f"pub_result.data has no attribute named '{reg_name}'")
-                                        return None
-
-                                    # Try with the determined or default classical register name first
-                                    extracted_counts = attempt_extraction(creg_name)
-
-                                    # If failed, try common default names or inspect other attributes
-                                    if extracted_counts is None:
-                                        logger.info("Primary extraction failed. Trying common register names or inspecting attributes.")
-                                        common_names = ['c', 'meas', 'measurement'] # Add other potential names if needed
-                                        if creg_name in common_names: # Avoid re-trying the same name
-                                            common_names.remove(creg_name)
-                                            
-                                        for name in common_names:
-                                            extracted_counts = attempt_extraction(name)
-                                            if extracted_counts is not None:
-                                                break # Stop if successful
-
-                                    # If still None, inspect all attributes of pub_result.data
-                                    if extracted_counts is None:
-                                        logger.warning("Could not extract counts using known/common register names. Inspecting all data attributes.")
-                                        for attr in dir(pub_result.data):
-                                            if not attr.startswith('_'):
-                                                logger.debug(f"Inspecting attribute: {attr}")
-                                                attr_value = getattr(pub_result.data, attr)
-                                                if hasattr(attr_value, 'get_counts'):
-                                                    logger.info(f"Found get_counts method on attribute: {attr}. Attempting extraction.")
-                                                    extracted_counts = attempt_extraction(attr)
-                                                    if extracted_counts is not None:
-                                                        break # Stop if successful
-                                                        
-                                    # Assign to result_counts if extraction was successful
-                                    if extracted_counts is not None:
-                                        result_counts = extracted_counts
-                                    else:
-                                        logger.error("Failed to extract counts from pub_result.data using all known methods.")
-
-                                else:
-                                    logger.error("pub_result has no data attribute")
-                            else:
-                                logger.error("result has no _pub_results attribute or it's empty")
+                        logger.info("Result object type: %s", type(result))
+                        # Guarded: dir() allocates a large sorted list even
+                        # when debug logging is off
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Result object attributes: %s", dir(result))
                         
+                        # Extract counts via the per-result-type dispatch:
+                        # the first job of a given result class probes the
+                        # known shapes, later ones jump straight to the
+                        # accessor that worked
+                        result_counts = _extract_counts(result, circuit)
+
                         # If we found valid counts, use them
                         if result_counts is not None:
                             counts = result_counts
@@ -390,22 +735,20 @@ def run_on_ibm_hardware(qasm_file: str, device_id: str = None, shots: int = 1024
                             counts = {"error_extracting_counts": 1}
                             
                         # Return dictionary with counts and metadata
+                        if counts_format == "soa" and "error" not in counts:
+                            keys, values = _counts_to_soa(counts)
+                            return {"counts": counts, "counts_keys": keys,
+                                    "counts_values": values, "metadata": metadata}
                         return {"counts": counts, "metadata": metadata}
                         
                     except Exception as e:
                         error_msg = f"Failed to process result: {str(e)}"
                         logger.error(error_msg)
-                        return {"counts": {"error": 1}, "metadata": {
-                            **metadata,
-                            'error': error_msg
-                        }}
+                        return {"counts": {"error": 1}, "metadata": {**metadata, 'error': error_msg}}
                 else:
-                    error_msg = f"Job failed or timed out. Final status: {job.status()}"
+                    error_msg = f"Job failed or timed out. Final status: {job_final_status}"
                     logger.error(error_msg)
-                    return {"counts": {"error": 1}, "metadata": {
-                        **metadata,
-                        'error': error_msg
-                    }}
+                    return {"counts": {"error": 1}, "metadata": {**metadata, 'error': error_msg}}
             else:
                 # Return a placeholder result with job information
                 return {"counts": {"pending": shots}, "metadata": {
@@ -421,22 +764,467 @@ def run_on_ibm_hardware(qasm_file: str, device_id: str = None, shots: int = 1024
             # Special handling for unbound local error for counts
             if isinstance(e, UnboundLocalError) and "local variable 'counts' referenced before assignment" in str(e):
                 logger.error("Caught counts variable reference error, using default value")
-                return {"counts": {"error_unbound_counts": 1}, "metadata": {
-                    'platform': 'ibm',
-                    'device_id': device_id,
-                    'error': "Failed to process result: counts variable was not properly assigned"
-                }}
+                return _error_result(device_id, "Failed to process result: counts variable was not properly assigned")
             
-            return {"counts": {"error": 1}, "metadata": {
-                'platform': 'ibm',
-                'device_id': device_id,
-                'error': error_msg
-            }}
+            return _error_result(device_id, error_msg)
             
     except Exception as e:
         error_msg = f"Error in run_on_ibm_hardware: {str(e)}"
         logger.error(error_msg)
-        return {"counts": {"error": 1}, "metadata": {
+        return _error_result(device_id, error_msg)
+
+
+def _resolve_ibm_api_token(api_token: Optional[str] = None) -> Optional[str]:
+    """
+    Resolve the IBM Quantum API token from arguments, environment or saved account.
+
+    Returns the token string, the "USING_SAVED_ACCOUNT" placeholder when
+    Qiskit saved credentials are usable, or None when nothing is found.
+    """
+    if api_token:
+        logger.info("Using IBM Quantum API token provided in arguments.")
+        return api_token
+
+    for env_var in ['QISKIT_IBM_TOKEN', 'IBM_QUANTUM_TOKEN', 'IBM_API_TOKEN']:
+        if env_var in os.environ and os.environ[env_var]:
+            logger.info(f"Using IBM Quantum API token from environment variable: {env_var}")
+            return os.environ[env_var]
+
+    if _PROVIDER_OK:
+        try:
+            from qiskit_ibm_provider import IBMProvider
+            # This uses credentials saved via IBMProvider.save_account()
+            IBMProvider()
+            logger.info("Using IBM Quantum credentials from Qiskit saved account.")
+            return "USING_SAVED_ACCOUNT"
+        except Exception as e:
+            logger.warning(f"Error accessing saved IBM credentials: {e}")
+
+    return None
+
+
+def _counts_via_get_counts(result, circuit) -> Optional[Dict[str, int]]:
+    """Extract counts from a standard Qiskit Result via get_counts()."""
+    if hasattr(result, 'get_counts'):
+        try:
+            return result.get_counts(0)
+        except Exception as e:
+            logger.warning(f"Failed to extract counts using get_counts(): {str(e)}")
+    return None
+
+
+def _counts_via_data_attr(result, circuit) -> Optional[Dict[str, int]]:
+    """Extract counts from a result exposing a data.counts attribute."""
+    data = getattr(result, 'data', None)
+    return getattr(data, 'counts', None) if data is not None else None
+
+
+def _counts_via_pub_results(result, circuit) -> Optional[Dict[str, int]]:
+    """Extract counts from a SamplerV2 PrimitiveResult's first pub."""
+    pub_results = getattr(result, '_pub_results', None)
+    if pub_results:
+        return _extract_pub_counts(pub_results[0], circuit)
+    return None
+
+
+# Winning accessor memoized per result class: every job on a given API
+# version yields the same result type, so after the first extraction the
+# attribute-sniffing chain collapses to a single dict lookup
+_counts_extractor_cache: Dict[type, Any] = {}
+
+
+def _extract_counts(result, circuit) -> Optional[Dict[str, int]]:
+    """
+    Extract measurement counts from any known job result shape.
+
+    Dispatches straight to the accessor that worked for this result type
+    before; on a cache miss, tries the known shapes in order (standard
+    Result, data.counts, SamplerV2 PrimitiveResult) and remembers the
+    winner.
+    """
+    cached = _counts_extractor_cache.get(type(result))
+    if cached is not None:
+        counts = cached(result, circuit)
+        if counts is not None:
+            return counts
+        logger.warning("Cached counts extractor failed for %s; re-probing",
+                       type(result).__name__)
+
+    for extractor in (_counts_via_get_counts, _counts_via_data_attr,
+                      _counts_via_pub_results):
+        counts = extractor(result, circuit)
+        if counts is not None:
+            _counts_extractor_cache[type(result)] = extractor
+            return counts
+    return None
+
+
+def _extract_pub_counts(pub_result, circuit) -> Optional[Dict[str, int]]:
+    """
+    Extract measurement counts from a SamplerV2 pub result.
+
+    Tries the circuit's own classical register name first, then common
+    register names, then any data attribute exposing get_counts().
+    """
+    data = getattr(pub_result, 'data', None)
+    if data is None:
+        logger.error("pub_result has no data attribute")
+        return None
+
+    names = []
+    if hasattr(circuit, 'cregs') and circuit.cregs:
+        names.append(circuit.cregs[0].name)
+    names.extend(name for name in ('c', 'meas', 'measurement') if name not in names)
+
+    for name in names:
+        creg_data = getattr(data, name, None)
+        if creg_data is not None and hasattr(creg_data, 'get_counts'):
+            try:
+                return creg_data.get_counts()
+            except Exception as e:
+                logger.warning(f"Error calling get_counts on register '{name}': {e}")
+
+    # Last resort: scan the data attributes for anything countable
+    for attr in dir(data):
+        if attr.startswith('_'):
+            continue
+        attr_value = getattr(data, attr)
+        if hasattr(attr_value, 'get_counts'):
+            try:
+                return attr_value.get_counts()
+            except Exception as e:
+                logger.warning(f"Error calling get_counts on attribute '{attr}': {e}")
+
+    return None
+
+
+def run_batch_on_ibm_hardware(qasm_files: List[str], device_id: str = None, shots: int = 1024,
+                              poll_timeout_seconds: int = 3600, optimization_level: int = 1,
+                              api_token: Optional[str] = None,
+                              poll_interval_floor: float = POLL_INTERVAL_FLOOR_SECONDS,
+                              **kwargs) -> List[Dict[str, Any]]:
+    """
+    Run several QASM files on IBM Quantum hardware as a single Runtime job.
+
+    Submitting the circuits as one sampler pub list pays the queue wait
+    once for the whole batch instead of once per circuit, and lets the
+    Runtime compile them in parallel.
+
+    Args:
+        qasm_files: Paths to the QASM files
+        device_id: IBM Quantum backend name
+        shots: Number of shots per circuit
+        poll_timeout_seconds: Maximum time to wait for results, in seconds
+        optimization_level: Transpiler optimization level (0-3)
+        api_token: IBM Quantum API token (optional)
+        poll_interval_floor: Initial delay between status polls, in seconds
+        **kwargs: Additional arguments
+
+    Returns:
+        List[Dict[str, Any]]: One counts/metadata dictionary per circuit,
+        in input order
+    """
+    def error_results(message: str) -> List[Dict[str, Any]]:
+        logger.error(message)
+        return [_error_result(device_id, message) for _ in qasm_files]
+
+    try:
+        if not _QISKIT_OK or not _RUNTIME_OK:
+            return error_results("Qiskit and qiskit-ibm-runtime are required for batch IBM hardware runs.")
+        from qiskit import QuantumCircuit, transpile
+
+        ibm_api_token = _resolve_ibm_api_token(api_token)
+        if not ibm_api_token:
+            return error_results(
+                "IBM Quantum API token not found. Please provide it using --api-token or set it "
+                "as an environment variable (QISKIT_IBM_TOKEN, IBM_QUANTUM_TOKEN)."
+            )
+
+        # Parse all circuits up front, straight from the strings in memory
+        circuits = []
+        qasm_strs = []
+        for qasm_file in qasm_files:
+            with open(qasm_file, 'r') as f:
+                qasm_str = f.read()
+            qasm_strs.append(qasm_str)
+            circuits.append(QuantumCircuit.from_qasm_str(qasm_str))
+
+        service = _get_runtime_service(ibm_api_token)
+
+        if not service.active_account():
+            return error_results("IBM Quantum credentials invalid or expired")
+
+        backends = _get_hardware_backends(service, ibm_api_token)
+        if not backends:
+            return error_results("No IBM Quantum devices available")
+
+        if device_id and any(b.name == device_id for b in backends):
+            device = next(b for b in backends if b.name == device_id)
+            logger.info(f"Using specified device: {device.name}")
+        else:
+            if device_id:
+                logger.warning(f"Specified device {device_id} not found or not available")
+            device = _least_busy(service, backends)
+            logger.info(f"Using least busy device: {device.name}")
+
+        # Reject over-wide circuits before transpiling or queueing anything
+        n_qubits = _device_num_qubits(device)
+        if n_qubits is not None:
+            widest = max(circuit.num_qubits for circuit in circuits)
+            if widest > n_qubits:
+                return error_results(
+                    f"Batch contains a {widest}-qubit circuit but device {device.name} has {n_qubits} qubits"
+                )
+
+        # Serve cache hits individually, then transpile the remaining
+        # circuits as one list so Qiskit fans them out across threads
+        transpiled = [
+            _transpile_cache_get(qasm_str, device, optimization_level)
+            for qasm_str in qasm_strs
+        ]
+        miss_indices = [i for i, t in enumerate(transpiled) if t is None]
+        if miss_indices:
+            fresh = transpile(
+                [circuits[i] for i in miss_indices],
+                backend=device, optimization_level=optimization_level
+            )
+            if not isinstance(fresh, list):
+                fresh = [fresh]
+            for i, circuit_transpiled in zip(miss_indices, fresh):
+                transpiled[i] = circuit_transpiled
+                _transpile_cache_put(qasm_strs[i], device, optimization_level, circuit_transpiled)
+
+        from qiskit_ibm_runtime import SamplerV2
+        sampler = SamplerV2(mode=device, options={"default_shots": shots})
+        job = sampler.run(transpiled)
+        job_id = job.job_id()
+        logger.info(f"Submitted batch of {len(circuits)} circuits to {device.name}, job ID: {job_id}")
+
+        # Prefer the Runtime's event-driven wait; poll with backoff only if
+        # it is unavailable or fails
+        start_time = time.time()
+        waited = False
+        if hasattr(job, 'wait_for_final_state'):
+            try:
+                job.wait_for_final_state(timeout=poll_timeout_seconds)
+                waited = True
+            except Exception as e:
+                logger.warning(f"wait_for_final_state failed ({e}); falling back to status polling")
+
+        last_status = None
+        if not waited:
+            poll_interval = kwargs.get('poll_interval_initial', poll_interval_floor)
+            poll_interval_max = kwargs.get('poll_interval_max', POLL_INTERVAL_CAP_SECONDS)
+            poll_backoff = kwargs.get('poll_backoff', POLL_BACKOFF_FACTOR)
+            while time.time() - start_time < poll_timeout_seconds:
+                job_status = job.status()
+                if _is_terminal(job_status):
+                    last_status = job_status
+                    break
+                time.sleep(poll_interval)
+                poll_interval = min(poll_interval * poll_backoff, poll_interval_max)
+
+        final_status = last_status if last_status is not None else job.status()
+        if not _is_done(final_status):
+            return error_results(f"Batch job failed or timed out. Final status: {final_status}")
+
+        result = job.result()
+        metadata = {
+            'platform': 'ibm',
+            'provider': 'IBM',
+            'device': device.name,
+            'device_id': device_id,
+            'provider_job_id': job_id,
+            'optimization_level': optimization_level,
+            'shots': shots,
+            'execution_time': time.time() - start_time,
+        }
+
+        results = []
+        for index, circuit in enumerate(circuits):
+            counts = _extract_pub_counts(result[index], circuit)
+            if counts is None:
+                logger.warning(f"No counts could be extracted for circuit {index}, using default")
+                counts = {"error_extracting_counts": 1}
+            results.append({"counts": counts, "metadata": {**metadata, 'circuit_index': index}})
+        return results
+
+    except Exception as e:
+        return error_results(f"Error in run_batch_on_ibm_hardware: {str(e)}")
+
+
+# Fire-and-forget submissions run on a small shared pool so the caller
+# gets a handle back immediately instead of blocking on transpile+submit
+# (seconds); the pool is created lazily to avoid spawning threads at import
+_submit_pool: Optional[ThreadPoolExecutor] = None
+_pending_submissions: Dict[str, Future] = {}
+
+
+def _get_submit_pool() -> ThreadPoolExecutor:
+    """Create or reuse the shared submission pool."""
+    global _submit_pool
+    with _cache_lock:
+        if _submit_pool is None:
+            _submit_pool = ThreadPoolExecutor(
+                max_workers=min(8, os.cpu_count() or 1),
+                thread_name_prefix="ibm-submit",
+            )
+        return _submit_pool
+
+
+def submit_on_ibm_hardware(qasm_file: str, device_id: str = None, shots: int = 1024,
+                           optimization_level: int = 1, api_token: Optional[str] = None,
+                           **kwargs) -> Dict[str, Any]:
+    """
+    Submit a QASM file to IBM hardware without blocking on transpile+submit.
+
+    run_on_ibm_hardware with wait_for_results=False still pays for backend
+    selection, transpilation and the submission POST before returning. This
+    wrapper pushes all of that onto a background pool and returns a
+    submission handle immediately, so pipelines enqueueing many jobs overlap
+    circuit N+1's transpile with circuit N's queue wait.
+
+    Args:
+        qasm_file: Path to the QASM file
+        device_id: IBM Quantum backend name
+        shots: Number of shots to run
+        optimization_level: Transpiler optimization level (0-3)
+        api_token: IBM Quantum API token (optional)
+        **kwargs: Forwarded to run_on_ibm_hardware
+
+    Returns:
+        Dict[str, Any]: Pending placeholder carrying a submission_id usable
+        with get_submission_result()
+    """
+    submission_id = uuid.uuid4().hex
+    future = _get_submit_pool().submit(
+        run_on_ibm_hardware,
+        qasm_file=qasm_file,
+        device_id=device_id,
+        shots=shots,
+        wait_for_results=False,
+        optimization_level=optimization_level,
+        api_token=api_token,
+        **kwargs,
+    )
+    _pending_submissions[submission_id] = future
+    logger.info(f"Queued background IBM submission {submission_id} for {qasm_file}")
+    return {"counts": {"pending": shots}, "metadata": {
+        'platform': 'ibm',
+        'device_id': device_id,
+        'submission_id': submission_id,
+        'status': 'SUBMITTING',
+        'message': 'Submission running in background; poll with get_submission_result()'
+    }}
+
+
+def get_submission_result(submission_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Fetch the outcome of a background submission.
+
+    Returns None for unknown ids, a SUBMITTING placeholder while the
+    background submission is still in flight, and the runner's result
+    dictionary (with the provider job id) once it lands.
+    """
+    future = _pending_submissions.get(submission_id)
+    if future is None:
+        return None
+    if not future.done():
+        return {"counts": {"pending": 1}, "metadata": {
             'platform': 'ibm',
-            'error': error_msg
-        }} 
\ No newline at end of file
+            'submission_id': submission_id,
+            'status': 'SUBMITTING'
+        }}
+    _pending_submissions.pop(submission_id, None)
+    return future.result()
+
+
+def retrieve_ibm_result(provider_job_id: str, api_token: Optional[str] = None,
+                        poll_timeout_seconds: int = 0, **kwargs) -> Dict[str, Any]:
+    """
+    Fetch the result of a previously submitted Runtime job by its job id.
+
+    This is the polling-worker half of fire-and-forget submission: submit
+    with wait_for_results=False (or submit_on_ibm_hardware), persist the
+    provider job id, and let a background worker call this later instead of
+    a web thread sleeping through the device queue.
+
+    Args:
+        provider_job_id: IBM Runtime job id returned at submission time
+        api_token: IBM Quantum API token (optional)
+        poll_timeout_seconds: When > 0, block up to this long for the job to
+            finish; when 0 (default), return a pending placeholder if the
+            job is not yet terminal
+        **kwargs: Additional arguments
+
+    Returns:
+        Dict[str, Any]: Dictionary containing counts and metadata
+    """
+    if not _RUNTIME_OK:
+        return _error_result(None, "qiskit-ibm-runtime is not installed.")
+
+    ibm_api_token = _resolve_ibm_api_token(api_token)
+    if not ibm_api_token:
+        return _error_result(None, "IBM Quantum API token not found.")
+
+    metadata = {
+        'platform': 'ibm',
+        'provider': 'IBM',
+        'provider_job_id': provider_job_id,
+    }
+
+    try:
+        service = _get_runtime_service(ibm_api_token)
+        job = service.job(provider_job_id)
+
+        status = job.status()
+        if not _is_terminal(status):
+            if poll_timeout_seconds <= 0:
+                return {"counts": {"pending": 1}, "metadata": {
+                    **metadata,
+                    'status': str(status),
+                }}
+
+            if hasattr(job, 'wait_for_final_state'):
+                job.wait_for_final_state(timeout=poll_timeout_seconds)
+                status = job.status()
+            else:
+                # A blocking wait was requested, so fall back to status
+                # polling with backoff rather than returning pending
+                start_time = time.time()
+                poll_interval = kwargs.get('poll_interval_initial', POLL_INTERVAL_FLOOR_SECONDS)
+                poll_interval_max = kwargs.get('poll_interval_max', POLL_INTERVAL_CAP_SECONDS)
+                poll_backoff = kwargs.get('poll_backoff', POLL_BACKOFF_FACTOR)
+                while time.time() - start_time < poll_timeout_seconds:
+                    status = job.status()
+                    if _is_terminal(status):
+                        break
+                    time.sleep(poll_interval)
+                    poll_interval = min(poll_interval * poll_backoff, poll_interval_max)
+
+            if not _is_terminal(status):
+                return {"counts": {"pending": 1}, "metadata": {
+                    **metadata,
+                    'status': str(status),
+                }}
+
+        if not _is_done(status):
+            return {"counts": {"error": 1}, "metadata": {
+                **metadata,
+                'error': f"Job ended in status {status}",
+            }}
+
+        result = job.result()
+        counts = _extract_counts(result, circuit=None)
+        if counts is None:
+            logger.warning("No counts could be extracted, using default")
+            counts = {"error_extracting_counts": 1}
+
+        metadata['status'] = 'DONE'
+        _mark_job_complete(provider_job_id)
+        return {"counts": counts, "metadata": metadata}
+
+    except Exception as e:
+        error_msg = f"Error retrieving IBM result for job {provider_job_id}: {str(e)}"
+        logger.error(error_msg)
+        return {"counts": {"error": 1}, "metadata": {**metadata, 'error': error_msg}}
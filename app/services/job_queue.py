@@ -0,0 +1,162 @@
+"""
+Job queue service for asynchronous circuit execution.
+
+This module provides a Redis-backed task queue (via arq) for dispatching
+circuit execution jobs to worker processes. When arq or the Redis server is
+not available, callers fall back to in-process background execution so the
+API remains usable in development environments.
+"""
+from typing import Any, Dict, Optional
+
+import orjson
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+# Import arq with availability checking (optional dependency)
+try:
+    from arq import create_pool
+    from arq.connections import ArqRedis, RedisSettings
+    ARQ_AVAILABLE = True
+except ImportError:
+    ARQ_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+# Cached Redis connection pool (created lazily on first use)
+_redis_pool = None
+
+
+async def get_redis_pool() -> Optional["ArqRedis"]:
+    """
+    Get the shared arq Redis connection pool.
+
+    The pool is created lazily on first use and cached for the lifetime of
+    the process.
+
+    Returns:
+        The arq Redis pool, or None if arq is not installed, no Redis URL is
+        configured, or the Redis server cannot be reached
+    """
+    global _redis_pool
+
+    if not ARQ_AVAILABLE or not settings.REDIS_URL:
+        return None
+
+    if _redis_pool is None:
+        try:
+            _redis_pool = await create_pool(
+                RedisSettings.from_dsn(settings.REDIS_URL)
+            )
+            logger.info(f"Connected to Redis job queue at {settings.REDIS_URL}")
+        except Exception as e:
+            logger.warning(f"Redis job queue unavailable, falling back to in-process execution: {e}")
+            return None
+
+    return _redis_pool
+
+
+async def enqueue_execution(job_id: str) -> bool:
+    """
+    Enqueue a circuit execution job on the Redis-backed task queue.
+
+    Args:
+        job_id: ID of the job to execute
+
+    Returns:
+        True if the job was enqueued on Redis, False if no queue is available
+        (in which case the caller should fall back to in-process execution)
+    """
+    redis_pool = await get_redis_pool()
+    if redis_pool is None:
+        return False
+
+    # The pool is cached, so Redis dying after creation surfaces here:
+    # treat it like an unavailable queue instead of failing the request
+    try:
+        await redis_pool.enqueue_job("execute_circuit_task", job_id)
+    except Exception as e:
+        logger.warning(f"Failed to enqueue job {job_id} on Redis, falling back to in-process execution: {e}")
+        return False
+
+    logger.info(f"Job {job_id} enqueued on Redis job queue")
+    return True
+
+
+async def save_job_record(job: Dict[str, Any]) -> None:
+    """
+    Mirror a job record into a Redis hash (best effort).
+
+    Records are stored under ``jobs:{job_id}`` with a TTL so worker
+    processes can load jobs enqueued by the API process and stale records
+    expire on their own. A no-op when no Redis pool is available.
+
+    Args:
+        job: Job record to persist
+    """
+    redis_pool = await get_redis_pool()
+    if redis_pool is None:
+        return
+
+    key = f"jobs:{job['job_id']}"
+    try:
+        mapping = {field: orjson.dumps(value) for field, value in job.items()}
+        await redis_pool.hset(key, mapping=mapping)
+        await redis_pool.expire(key, settings.JOB_RECORD_TTL_SECONDS)
+    except Exception as e:
+        logger.warning(f"Failed to persist job record {key} to Redis: {e}")
+
+
+async def load_job_record(job_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a job record from its Redis hash.
+
+    Args:
+        job_id: ID of the job to load
+
+    Returns:
+        The job record, or None if no Redis pool is available or the
+        record does not exist
+    """
+    redis_pool = await get_redis_pool()
+    if redis_pool is None:
+        return None
+
+    key = f"jobs:{job_id}"
+    try:
+        raw = await redis_pool.hgetall(key)
+    except Exception as e:
+        logger.warning(f"Failed to load job record {key} from Redis: {e}")
+        return None
+
+    if not raw:
+        return None
+
+    return {
+        (field.decode() if isinstance(field, bytes) else field): orjson.loads(value)
+        for field, value in raw.items()
+    }
+
+
+async def execute_circuit_task(ctx: Dict[str, Any], job_id: str) -> Dict[str, Any]:
+    """
+    arq worker entrypoint for circuit execution.
+
+    Args:
+        ctx: arq worker context
+        job_id: ID of the job to execute
+
+    Returns:
+        Execution results from the circuit dispatcher
+    """
+    # Imported here to avoid a circular import at module load time
+    from app.api.v1.circuits import _execute_circuit
+
+    return await _execute_circuit(job_id)
+
+
+class WorkerSettings:
+    """arq worker settings (run with `arq app.services.job_queue.WorkerSettings`)."""
+    functions = [execute_circuit_task]
+    if ARQ_AVAILABLE and settings.REDIS_URL:
+        redis_settings = RedisSettings.from_dsn(settings.REDIS_URL)
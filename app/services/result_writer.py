@@ -0,0 +1,80 @@
+"""
+Background writer for job result files.
+
+Result files are an archive of completed jobs, so their disk writes don't
+need to sit on the job's critical path. Writes are queued and flushed by a
+single background task, which also lets bursts of completions be drained
+in one pass instead of an fsync-sized write per job.
+"""
+import asyncio
+from typing import Optional, Tuple
+
+import aiofiles
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_queue: Optional["asyncio.Queue[Tuple[str, bytes]]"] = None
+_flusher: Optional[asyncio.Task] = None
+
+
+def _ensure_flusher() -> "asyncio.Queue[Tuple[str, bytes]]":
+    """Create the queue and flusher task on first use (requires a running loop)."""
+    global _queue, _flusher
+    if _queue is None:
+        _queue = asyncio.Queue()
+    if _flusher is None or _flusher.done():
+        _flusher = asyncio.get_running_loop().create_task(_flush_loop())
+    return _queue
+
+
+async def enqueue_write(path: str, payload: bytes) -> None:
+    """
+    Queue a result payload for writing by the background flusher.
+
+    Args:
+        path: Destination file path
+        payload: Serialized result bytes
+    """
+    _ensure_flusher().put_nowait((path, payload))
+
+
+async def shutdown() -> None:
+    """
+    Drain queued writes and stop the flusher.
+
+    Called from the application's lifespan shutdown so results queued but
+    not yet flushed still reach disk before the process exits; without
+    this, a restart silently drops them.
+    """
+    global _queue, _flusher
+    if _queue is not None:
+        await _queue.join()
+    if _flusher is not None and not _flusher.done():
+        _flusher.cancel()
+        try:
+            await _flusher
+        except asyncio.CancelledError:
+            pass
+    _queue = None
+    _flusher = None
+
+
+async def _flush_loop() -> None:
+    """Drain queued result writes, batching whatever has accumulated."""
+    while True:
+        batch = [await _queue.get()]
+        # Drain anything else already queued so a burst of completions is
+        # written in one pass
+        while not _queue.empty():
+            batch.append(_queue.get_nowait())
+
+        for path, payload in batch:
+            try:
+                async with aiofiles.open(path, "wb") as f:
+                    await f.write(payload)
+            except Exception as e:
+                logger.error("Failed to write result file %s: %s", path, e)
+            finally:
+                _queue.task_done()
@@ -17,14 +17,37 @@ import re # Import re for include replacement
 # Set up logging for this module
 logger = logging.getLogger(__name__)
 
-def run_braket_simulation(qasm_file: str, shots: int = 1024, **kwargs) -> Optional[Dict[str, Any]]:
+# Local simulators cached per backend name: constructing LocalSimulator
+# loads the native simulator libraries and thread pools each time, a fixed
+# cost worth paying once per process rather than per circuit
+_local_simulators: Dict[str, Any] = {}
+
+
+def _get_local_simulator(backend_name: Optional[str] = None):
+    """Return a shared LocalSimulator, constructing one per backend name."""
+    from braket.devices import LocalSimulator
+
+    key = backend_name or "default"
+    simulator = _local_simulators.get(key)
+    if simulator is None:
+        simulator = LocalSimulator(backend_name) if backend_name else LocalSimulator()
+        _local_simulators[key] = simulator
+    return simulator
+
+def run_braket_simulation(qasm_file: str, shots: int = 1024,
+                          qasm_str: Optional[str] = None, **kwargs) -> Optional[Dict[str, Any]]:
     """
-    Runs an OpenQASM 2.0 circuit file using the AWS Braket local simulator via the qiskit-braket-provider.
-    QASM 3.0 is explicitly not supported by this backend due to parsing limitations.
+    Runs an OpenQASM circuit file using the AWS Braket local simulator.
+
+    The QASM source is handed straight to the Braket SDK where possible;
+    inputs the SDK cannot parse fall back to the Qiskit QASM 2.0 parser
+    plus the qiskit-braket-provider conversion. QASM 3.0 is only supported
+    on the direct SDK path.
 
     Args:
         qasm_file (str): Path to the OpenQASM 2.0 file.
         shots (int): Number of simulation shots.
+        qasm_str (Optional[str]): QASM content to use directly, skipping the file read.
         **kwargs: Additional backend-specific options (currently unused for Braket).
 
     Returns:
@@ -40,50 +63,74 @@ def run_braket_simulation(qasm_file: str, shots: int = 1024, **kwargs) -> Option
     start_time = time.time()
 
     try:
-        # Import necessary components
+        # Import necessary components; the Qiskit conversion path imports
+        # its own dependencies only if the direct SDK parse falls through
         from braket.devices import LocalSimulator
         from braket.circuits import Circuit as BraketCircuit
-        from qiskit import QuantumCircuit
-        from qiskit.qasm2.exceptions import QASM2ParseError
-        from qiskit_braket_provider.providers.adapter import convert_qiskit_to_braket_circuit
 
     except ImportError as e:
-        logger.error(f"Braket SDK or Qiskit/Provider dependencies not installed: {e}")
-        print(f"Error: Missing library for Braket/Qiskit. Run 'pip install amazon-braket-sdk amazon-braket-default-simulator qiskit qiskit-braket-provider'. Details: {e}", file=sys.stderr)
+        logger.error(f"Braket SDK dependencies not installed: {e}")
+        print(f"Error: Missing library for Braket. Run 'pip install amazon-braket-sdk amazon-braket-default-simulator'. Details: {e}", file=sys.stderr)
         raise
 
-    qasm_path = Path(qasm_file)
-    if not qasm_path.is_file():
-        logger.error(f"QASM file not found: {qasm_file}")
-        raise FileNotFoundError(f"QASM file not found: {qasm_file}")
+    if qasm_str is None:
+        qasm_path = Path(qasm_file)
+        if not qasm_path.is_file():
+            logger.error(f"QASM file not found: {qasm_file}")
+            raise FileNotFoundError(f"QASM file not found: {qasm_file}")
 
     try:
-        with open(qasm_path, 'r') as f:
-            qasm_str = f.read()
-        logger.debug(f"Read QASM content from {qasm_file}")
+        # Use in-memory QASM content when provided, avoiding a disk round-trip
+        if qasm_str is None:
+            with open(qasm_path, 'r') as f:
+                qasm_str = f.read()
+        logger.debug("Read QASM content from %s", qasm_file)
         
         braket_circuit: Optional[BraketCircuit] = None
 
-        # Check for QASM3 and reject if found
-        if qasm_str.strip().startswith("OPENQASM 3"):
-            logger.error("Detected OpenQASM 3.0 input, which is not supported by the Braket backend's current Qiskit conversion path.")
-            print("Error: OpenQASM 3.0 input is not supported for the 'braket' backend with this implementation.", file=sys.stderr)
-            return None # Indicate failure for QASM3
-
-        # Proceed assuming QASM 2.0
-        logger.info("Assuming OpenQASM 2.0 input. Attempting Qiskit parsing + provider conversion.")
+        # Fast path: hand the QASM source straight to the Braket SDK. This
+        # skips the Qiskit parse and the O(gates) adapter walk — and the
+        # Qiskit import entirely — and is also the only path that can
+        # handle OpenQASM 3.0 input.
         try:
-            qiskit_circuit = QuantumCircuit.from_qasm_str(qasm_str)
-            braket_circuit = convert_qiskit_to_braket_circuit(qiskit_circuit)
-            logger.info("Successfully processed via Qiskit QASM2 + provider.")
-        except QASM2ParseError as q2_error:
-            logger.error(f"OpenQASM 2.0 parsing failed: {q2_error}", exc_info=True)
-            print(f"Error: Failed to parse OpenQASM 2.0 file: {q2_error}", file=sys.stderr)
-            return None
-        except Exception as qiskit_conv_error:
-            logger.error(f"Qiskit QASM2 processing/conversion failed: {qiskit_conv_error}", exc_info=True)
-            print(f"Error: Failed processing via Qiskit QASM2 path: {qiskit_conv_error}", file=sys.stderr)
-            return None
+            from braket.ir.openqasm import Program as OpenQASMProgram
+            braket_circuit = BraketCircuit.from_ir(OpenQASMProgram(source=qasm_str))
+            logger.info("Parsed QASM directly with the Braket SDK.")
+        except Exception as direct_error:
+            logger.info(f"Direct Braket QASM parse failed ({direct_error}); trying Qiskit conversion.")
+            braket_circuit = None
+
+        if braket_circuit is None:
+            # Fallback: Qiskit QASM 2.0 parse + provider conversion. QASM 3.0
+            # that the SDK could not parse cannot be salvaged here.
+            # Sniff only the head of the source: .strip() on the whole
+            # string copies it just to inspect a ten-character prefix
+            if qasm_str[:256].lstrip().startswith("OPENQASM 3"):
+                logger.error("Detected OpenQASM 3.0 input that the Braket SDK could not parse; the Qiskit fallback only handles QASM 2.0.")
+                print("Error: This OpenQASM 3.0 input is not supported for the 'braket' backend.", file=sys.stderr)
+                return None # Indicate failure for QASM3
+
+            logger.info("Assuming OpenQASM 2.0 input. Attempting Qiskit parsing + provider conversion.")
+            try:
+                from qiskit import QuantumCircuit
+                from qiskit.qasm2.exceptions import QASM2ParseError
+                from qiskit_braket_provider.providers.adapter import convert_qiskit_to_braket_circuit
+            except ImportError as e:
+                logger.error(f"Qiskit/Provider dependencies not installed for the fallback path: {e}")
+                print(f"Error: Missing library for Braket/Qiskit fallback. Run 'pip install qiskit qiskit-braket-provider'. Details: {e}", file=sys.stderr)
+                raise
+            try:
+                qiskit_circuit = QuantumCircuit.from_qasm_str(qasm_str)
+                braket_circuit = convert_qiskit_to_braket_circuit(qiskit_circuit)
+                logger.info("Successfully processed via Qiskit QASM2 + provider.")
+            except QASM2ParseError as q2_error:
+                logger.error(f"OpenQASM 2.0 parsing failed: {q2_error}", exc_info=True)
+                print(f"Error: Failed to parse OpenQASM 2.0 file: {q2_error}", file=sys.stderr)
+                return None
+            except Exception as qiskit_conv_error:
+                logger.error(f"Qiskit QASM2 processing/conversion failed: {qiskit_conv_error}", exc_info=True)
+                print(f"Error: Failed processing via Qiskit QASM2 path: {qiskit_conv_error}", file=sys.stderr)
+                return None
         
         # If we reach here, braket_circuit should be valid
         if braket_circuit is None:
@@ -92,11 +139,11 @@ def run_braket_simulation(qasm_file: str, shots: int = 1024, **kwargs) -> Option
             print("Error: Could not process QASM 2.0 into a runnable format for Braket.", file=sys.stderr)
             return None
 
-        logger.debug(f"Running on Braket. Target type: BraketCircuit")
+        logger.debug("Running on Braket. Target type: BraketCircuit")
         # logger.debug(f"Target details: {braket_circuit}") # Can be very verbose
 
-        # Run the simulation on Braket Local Simulator
-        simulator = LocalSimulator()
+        # Run the simulation on the shared Braket Local Simulator
+        simulator = _get_local_simulator(kwargs.get("braket_backend_name"))
         logger.info(f"Running Braket simulation job on {simulator.name}...")
 
         # Braket returns different result types based on shots
@@ -106,7 +153,7 @@ def run_braket_simulation(qasm_file: str, shots: int = 1024, **kwargs) -> Option
             # Measurement counts are directly available
             raw_counts = result.measurement_counts
             logger.info(f"Braket simulation completed. Status: {result.task_metadata.status}")
-            logger.debug(f"Raw counts: {raw_counts}")
+            logger.debug("Raw counts: %s", raw_counts)
             counts = {k: int(v) for k, v in raw_counts.items()}
             metadata = { "status": result.task_metadata.status, "backend": simulator.name }
         else:
@@ -126,9 +173,27 @@ def run_braket_simulation(qasm_file: str, shots: int = 1024, **kwargs) -> Option
 
             probabilities = result.result_types[0].value 
             num_qubits = braket_circuit.qubit_count
-            counts = {format(i, f'0{num_qubits}b'): prob for i, prob in enumerate(probabilities)}
+            # Only materialize bitstrings for states with non-negligible
+            # probability: the full spectrum is 2^n entries, almost all of
+            # them zero for structured circuits, and formatting each one
+            # into a Python string dominated the shots=0 path
+            import numpy as np
+            probs = np.asarray(probabilities)
+            threshold = kwargs.get("probability_threshold", 0.0)
+            support = np.nonzero(probs > threshold)[0]
+            if support.size:
+                # Unpack the index bits and render every bitstring in one
+                # vectorized pass: a byte matrix of '0'/'1' characters
+                # reinterpreted row-wise as fixed-width strings, instead of
+                # a Python-level format call per basis state
+                bits = ((support[:, None].astype(np.int64)
+                         >> np.arange(num_qubits - 1, -1, -1)) & 1).astype(np.uint8)
+                keys = (bits + ord('0')).view(f'S{num_qubits}').ravel().astype(str)
+                counts = dict(zip(keys.tolist(), probs[support].tolist()))
+            else:
+                counts = {}
             logger.info(f"Braket probability calculation completed. Status: {result.task_metadata.status}")
-            logger.debug(f"Probabilities: {counts}")
+            logger.debug("Probabilities: %s", counts)
             metadata = { "status": result.task_metadata.status, "backend": simulator.name, "result_type": "probabilities" }
 
         sim_result = {
@@ -7,6 +7,8 @@ import logging
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+import numpy as np
+
 # Using existing CircuitExecutionResult model instead of creating SimulationResult
 #from ...schemas.circuit import CircuitExecutionResponse
 
@@ -14,13 +16,15 @@ from typing import Optional, Dict, Any
 # Set up logging for this module
 logger = logging.getLogger(__name__)
 
-def run_cirq_simulation(qasm_file: str, shots: int = 1024, **kwargs) -> Optional[Dict[str, Any]]:
+def run_cirq_simulation(qasm_file: str, shots: int = 1024,
+                        qasm_str: Optional[str] = None, **kwargs) -> Optional[Dict[str, Any]]:
     """
     Runs an OpenQASM 2.0 circuit file using the Cirq simulator.
 
     Args:
         qasm_file (str): Path to the OpenQASM 2.0 file.
         shots (int): Number of simulation shots.
+        qasm_str (Optional[str]): QASM content to use directly, skipping the file read.
         **kwargs: Additional options (currently unused).
 
     Returns:
@@ -41,15 +45,19 @@ def run_cirq_simulation(qasm_file: str, shots: int = 1024, **kwargs) -> Optional
         print("Error: Cirq not found. Run 'pip install cirq-core'", file=sys.stderr)
         raise
 
-    qasm_path = Path(qasm_file)
-    if not qasm_path.is_file():
-        logger.error(f"QASM file not found: {qasm_file}")
-        raise FileNotFoundError(f"QASM file not found: {qasm_file}")
+    if qasm_str is None:
+        qasm_path = Path(qasm_file)
+        if not qasm_path.is_file():
+            logger.error(f"QASM file not found: {qasm_file}")
+            raise FileNotFoundError(f"QASM file not found: {qasm_file}")
 
     try:
-        # Load QASM file content
-        qasm_content = qasm_path.read_text()
-        logger.debug(f"Successfully read QASM file content from: {qasm_file}")
+        # Use in-memory QASM content when provided, avoiding a disk round-trip
+        if qasm_str is not None:
+            qasm_content = qasm_str
+        else:
+            qasm_content = qasm_path.read_text()
+        logger.debug("Successfully read QASM file content from: %s", qasm_file)
 
         # Parse QASM into a Cirq circuit
         circuit = circuit_from_qasm(qasm_content)
@@ -82,21 +90,28 @@ def run_cirq_simulation(qasm_file: str, shots: int = 1024, **kwargs) -> Optional
             
             # Find the key associated with the measurements (often 'm' or specific creg names)
             measurement_key = list(results.measurements.keys())[0] # Simplistic assumption
-            logger.debug(f"Using measurement key: '{measurement_key}'")
+            logger.debug("Using measurement key: '%s'", measurement_key)
 
             # Get the measurement outcomes (shape: (repetitions, num_measured_qubits))
             measurement_data = results.measurements[measurement_key]
 
-            # Convert each measurement outcome (row) into a bitstring
+            # Aggregate outcomes in NumPy instead of a per-shot Python loop:
+            # pack each row of bits into an integer, count the unique values,
+            # then format only the distinct outcomes as bitstrings
             num_measured_qubits = measurement_data.shape[1]
-            for i in range(shots):
-                bitstring = "".join(map(str, measurement_data[i]))
-                counts[bitstring] = counts.get(bitstring, 0) + 1
+            bit_weights = 1 << np.arange(num_measured_qubits - 1, -1, -1)
+            outcomes, outcome_counts = np.unique(
+                measurement_data.astype(np.int64) @ bit_weights, return_counts=True
+            )
+            counts = {
+                format(int(outcome), f"0{num_measured_qubits}b"): int(count)
+                for outcome, count in zip(outcomes, outcome_counts)
+            }
         else:
              logger.warning("Cirq simulation ran but no measurements found in the results object.")
 
         logger.info(f"Cirq simulation job completed.")
-        logger.debug(f"Raw counts (aggregated): {counts}")
+        logger.debug("Raw counts (aggregated): %s", counts)
 
         sim_result = {
             "counts": counts,
@@ -2,10 +2,13 @@
 Backend for running simulations using Qiskit Aer.
 """
 
+import hashlib
 import sys
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 # Using existing CircuitExecutionResult model instead of creating SimulationResult
 from ...schemas.circuit import CircuitExecutionResponse
@@ -14,14 +17,44 @@ from ...schemas.circuit import CircuitExecutionResponse
 # Set up logging for this module
 logger = logging.getLogger(__name__)
 
-
-def run_qiskit_simulation(qasm_file: str, shots: int = 1024, **kwargs) -> Optional[Dict[str, Any]]:
+# Parsed circuits cached by QASM content hash: QASM parsing dominates the
+# cost of small-circuit simulation, and parameter sweeps resubmit the same
+# text thousands of times. LRU-evicted beyond the cap.
+PARSED_CIRCUIT_CACHE_SIZE = 256
+_parsed_circuits: "OrderedDict[bytes, Any]" = OrderedDict()
+# Guards _parsed_circuits: simulations run on worker threads, and the
+# get/move_to_end/popitem sequence is not safe under concurrent mutation
+_parsed_circuits_lock = threading.Lock()
+
+
+def _parse_qasm_cached(qasm_str: str, quantum_circuit_cls) -> Any:
+    """Parse QASM into a circuit, reusing a cached parse for repeated content."""
+    key = hashlib.sha256(qasm_str.encode("utf-8")).digest()
+    with _parsed_circuits_lock:
+        circuit = _parsed_circuits.get(key)
+        if circuit is not None:
+            _parsed_circuits.move_to_end(key)
+            return circuit
+
+    # Parse outside the lock so a slow parse never serializes cache hits;
+    # a racing duplicate parse just overwrites with an equivalent circuit
+    circuit = quantum_circuit_cls.from_qasm_str(qasm_str)
+    with _parsed_circuits_lock:
+        _parsed_circuits[key] = circuit
+        while len(_parsed_circuits) > PARSED_CIRCUIT_CACHE_SIZE:
+            _parsed_circuits.popitem(last=False)
+    return circuit
+
+
+def run_qiskit_simulation(qasm_file: str, shots: int = 1024,
+                          qasm_str: Optional[str] = None, **kwargs) -> Optional[Dict[str, Any]]:
     """
     Runs an OpenQASM 2.0 circuit file using the Qiskit Aer simulator.
 
     Args:
         qasm_file (str): Path to the OpenQASM 2.0 file.
         shots (int): Number of simulation shots.
+        qasm_str (Optional[str]): QASM content to use directly, skipping the file read.
         **kwargs: Additional options (e.g., noise model parameters - TBD).
 
     Returns:
@@ -42,16 +75,23 @@ def run_qiskit_simulation(qasm_file: str, shots: int = 1024, **kwargs) -> Option
         print("Error: Qiskit/Qiskit Aer not found. Run 'pip install qiskit qiskit-aer'", file=sys.stderr)
         raise # Re-raise the ImportError
 
-    qasm_path = Path(qasm_file)
-    if not qasm_path.is_file():
-        logger.error(f"QASM file not found: {qasm_file}")
-        raise FileNotFoundError(f"QASM file not found: {qasm_file}")
+    if qasm_str is None:
+        qasm_path = Path(qasm_file)
+        if not qasm_path.is_file():
+            logger.error(f"QASM file not found: {qasm_file}")
+            raise FileNotFoundError(f"QASM file not found: {qasm_file}")
 
     try:
-        # Load circuit from QASM file
-        circuit = QuantumCircuit.from_qasm_file(str(qasm_path))
-        logger.debug(f"Successfully loaded QASM file: {qasm_file}")
-        logger.debug(f"Circuit details: {circuit.num_qubits} qubits, {circuit.num_clbits} classical bits, depth {circuit.depth()}")
+        # Load circuit from in-memory QASM content when provided, avoiding
+        # a disk round-trip for content the caller already holds; parses
+        # are cached by content hash either way
+        if qasm_str is None:
+            qasm_str = qasm_path.read_text()
+        circuit = _parse_qasm_cached(qasm_str, QuantumCircuit)
+        logger.debug("Successfully loaded QASM file: %s", qasm_file)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Circuit details: %d qubits, %d classical bits, depth %d",
+                         circuit.num_qubits, circuit.num_clbits, circuit.depth())
 
         # Set up the simulator
         # TODO: Add noise model support based on kwargs
@@ -64,7 +104,7 @@ def run_qiskit_simulation(qasm_file: str, shots: int = 1024, **kwargs) -> Option
         result = job.result()
         counts = result.get_counts(circuit)
         logger.info(f"Simulation job completed successfully. Status: {result.status}")
-        logger.debug(f"Raw counts: {counts}")
+        logger.debug("Raw counts: %s", counts)
 
         # Format results
         # Qiskit counts are { '00': N, '11': M }, convert to standardized format if needed
@@ -84,4 +124,79 @@ def run_qiskit_simulation(qasm_file: str, shots: int = 1024, **kwargs) -> Option
     except Exception as e:
         logger.error(f"An error occurred during Qiskit simulation: {e}", exc_info=True)
         print(f"Error during simulation: {e}", file=sys.stderr)
-        raise # Re-raise the exception after logging 
\ No newline at end of file
+        raise # Re-raise the exception after logging
+
+
+def run_qiskit_simulation_batch(qasm_files: List[str], shots: int = 1024,
+                                qasm_strs: Optional[List[Optional[str]]] = None,
+                                **kwargs) -> List[Dict[str, Any]]:
+    """
+    Runs several OpenQASM 2.0 circuits as a single Qiskit Aer job.
+
+    Aer accepts a list of circuits per run, so the simulator setup and job
+    dispatch overhead is paid once for the whole batch instead of per
+    circuit.
+
+    Args:
+        qasm_files (List[str]): Paths to the OpenQASM 2.0 files.
+        shots (int): Number of simulation shots per circuit.
+        qasm_strs (Optional[List[Optional[str]]]): Per-circuit QASM content
+            to use directly, skipping the file read where provided.
+        **kwargs: Additional options (e.g., noise model parameters - TBD).
+
+    Returns:
+        List[Dict[str, Any]]: One result dictionary per circuit, in input order.
+
+    Raises:
+        FileNotFoundError: If any QASM file does not exist.
+        ImportError: If qiskit or qiskit_aer is not installed.
+        Exception: For errors during circuit loading or simulation.
+    """
+    logger.info(f"Attempting batched Qiskit simulation for {len(qasm_files)} circuits with {shots} shots.")
+
+    try:
+        from qiskit import QuantumCircuit
+        from qiskit_aer import AerSimulator
+    except ImportError:
+        logger.error("Qiskit or Qiskit Aer is not installed. Please install them to run simulations.")
+        print("Error: Qiskit/Qiskit Aer not found. Run 'pip install qiskit qiskit-aer'", file=sys.stderr)
+        raise
+
+    if qasm_strs is None:
+        qasm_strs = [None] * len(qasm_files)
+
+    try:
+        circuits = []
+        for qasm_file, qasm_str in zip(qasm_files, qasm_strs):
+            if qasm_str is None:
+                qasm_path = Path(qasm_file)
+                if not qasm_path.is_file():
+                    logger.error(f"QASM file not found: {qasm_file}")
+                    raise FileNotFoundError(f"QASM file not found: {qasm_file}")
+                qasm_str = qasm_path.read_text()
+            circuits.append(_parse_qasm_cached(qasm_str, QuantumCircuit))
+
+        simulator = AerSimulator()
+        logger.info("Running batched simulation job...")
+        job = simulator.run(circuits, shots=shots)
+        result = job.result()
+        logger.info(f"Batched simulation job completed. Status: {result.status}")
+
+        # Index-based lookup: cached parses can repeat the same circuit
+        # object (and name) within a batch, which name-based lookup rejects
+        return [
+            {
+                "counts": result.get_counts(index),
+                "execution_time": 0.0,
+                "metadata": {"status": result.status}
+            }
+            for index in range(len(circuits))
+        ]
+
+    except FileNotFoundError as e:
+        logger.error(f"File not found error during batched simulation: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"An error occurred during batched Qiskit simulation: {e}", exc_info=True)
+        print(f"Error during simulation: {e}", file=sys.stderr)
+        raise 
\ No newline at end of file
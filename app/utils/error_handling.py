@@ -3,7 +3,8 @@ Error handling utilities for the Quantum Computing API.
 
 This module contains functions and classes for standardized error handling.
 """
-from typing import Dict, Any, Type
+import functools
+from types import MappingProxyType
 from fastapi import HTTPException, status
 
 from app.schemas.base import ResponseBase, ErrorModel
@@ -34,6 +35,18 @@ class ResourceNotFoundError(APIError):
             status_code=status.HTTP_404_NOT_FOUND
         )
 
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def get(cls, resource_type: str, resource_id: str) -> "ResourceNotFoundError":
+        """
+        Return a (possibly cached) error for the given resource.
+
+        Repeated 404s for the same id — a common pattern when a client
+        polls a finished or mistyped job — reuse one instance instead of
+        re-formatting the message and re-running exception init each time.
+        """
+        return cls(resource_type, resource_id)
+
 
 class ValidationError(APIError):
     """Error raised when request validation fails."""
@@ -55,21 +68,63 @@ class ExecutionError(APIError):
         )
 
 
+@functools.lru_cache(maxsize=512)
+def _build_error_response(code: str, message: str) -> ResponseBase[None]:
+    """Build the error envelope for one (code, message) pair, cached."""
+    # Constructed directly: Pydantic v2 shadows the ResponseBase.error
+    # classmethod with the field of the same name
+    return ResponseBase[None](
+        status="error",
+        data=None,
+        error=ErrorModel(code=code, message=message),
+    )
+
+
 def api_error_to_response(error: APIError) -> ResponseBase[None]:
     """
     Convert an API error to a standard response.
-    
+
+    Error shapes are static per (code, message) pair, so the Pydantic
+    model build is cached: under a validation storm the same failure
+    repeats thousands of times and each repeat becomes a dict lookup.
+
     Args:
         error: API error
-        
+
     Returns:
         Standard error response
     """
-    return ResponseBase.error(error.code, error.message)
+    return _build_error_response(error.code, error.message)
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_http_exception(code: str, message: str, status_code: int) -> HTTPException:
+    """Build the HTTPException for one error shape, cached.
+
+    Keyed on the full (code, message, status) triple rather than mutating
+    a shared detail dict: concurrent requests may hold the same instance
+    while FastAPI serializes it, so the cached exception must stay
+    immutable.
+    """
+    exc = HTTPException(status_code=status_code, detail={"code": code, "message": message})
+    exc.__traceback__ = None
+    return exc
+
+
+def raise_api_error(code: str, message: str, status_code: int = status.HTTP_400_BAD_REQUEST) -> None:
+    """Raise the cached HTTPException for the given error shape."""
+    raise _cached_http_exception(code, message, status_code)
+
 
+# One shared inner dict instead of three identical literals, and the
+# outer mapping frozen: route decorators only ever read this, identical
+# object identity lets FastAPI's schema-build caching short-circuit, and
+# accidental runtime mutation becomes a TypeError instead of a silent
+# cross-route change
+_SHARED_RESPONSE_MODEL = MappingProxyType({"model": ResponseBase})
 
-ERROR_RESPONSES = {
-    status.HTTP_400_BAD_REQUEST: {"model": ResponseBase},
-    status.HTTP_404_NOT_FOUND: {"model": ResponseBase},
-    status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ResponseBase},
-}
+ERROR_RESPONSES = MappingProxyType({
+    status.HTTP_400_BAD_REQUEST: _SHARED_RESPONSE_MODEL,
+    status.HTTP_404_NOT_FOUND: _SHARED_RESPONSE_MODEL,
+    status.HTTP_500_INTERNAL_SERVER_ERROR: _SHARED_RESPONSE_MODEL,
+})
@@ -22,14 +22,16 @@ def debug_ibm_quantum():
         from qiskit_ibm_runtime import QiskitRuntimeService, SamplerV2
         
         # Load the QASM circuit
-        logger.info(f"Loading circuit from {QASM_FILE}")
+        logger.info("Loading circuit from %s", QASM_FILE)
         circuit = QuantumCircuit.from_qasm_file(QASM_FILE)
-        logger.info(f"Circuit loaded: {circuit.name}")
-        logger.info(f"Number of qubits: {circuit.num_qubits}")
-        logger.info(f"Classical registers: {circuit.cregs}")
+        logger.info("Circuit loaded: %s", circuit.name)
+        logger.info("Number of qubits: %d", circuit.num_qubits)
+        logger.info("Classical registers: %s", circuit.cregs)
         
-        # Print circuit details
-        logger.info(f"Circuit drawing:\n{circuit.draw()}")
+        # Print circuit details; draw() walks every gate and builds a
+        # multi-kilobyte string, so only render it when debug is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Circuit drawing:\n%s", circuit.draw())
         
         # Get IBM Quantum credentials from environment
         ibm_api_token = os.environ.get('IBM_QUANTUM_TOKEN')
@@ -43,7 +45,7 @@ def debug_ibm_quantum():
         
         # Get available backends
         backends = service.backends(operational=True)
-        logger.info(f"Available backends: {[b.name for b in backends]}")
+        logger.info("Available backends: %s", [b.name for b in backends])
         
         # Try to find a simulator first
         backend = None
@@ -56,12 +58,13 @@ def debug_ibm_quantum():
             # Use least busy device
             backend = min(backends, key=lambda b: b.status().pending_jobs)
             
-        logger.info(f"Using backend: {backend.name}")
+        logger.info("Using backend: %s", backend.name)
         
         # Transpile the circuit for the backend
-        logger.info(f"Transpiling circuit for {backend.name}")
+        logger.info("Transpiling circuit for %s", backend.name)
         transpiled_circuit = transpile(circuit, backend=backend)
-        logger.info(f"Transpiled circuit:\n{transpiled_circuit.draw()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Transpiled circuit:\n%s", transpiled_circuit.draw())
         
         # Set options for the sampler
         options = {"default_shots": 1024}
@@ -71,90 +74,90 @@ def debug_ibm_quantum():
         sampler = SamplerV2(mode=backend, options=options)
         
         # Submit job
-        logger.info(f"Submitting job to {backend.name}")
+        logger.info("Submitting job to %s", backend.name)
         job = sampler.run([transpiled_circuit])
         job_id = job.job_id()
-        logger.info(f"Job ID: {job_id}")
-        logger.info(f"Monitor at: https://quantum.ibm.com/jobs/{job_id}")
+        logger.info("Job ID: %s", job_id)
+        logger.info("Monitor at: https://quantum.ibm.com/jobs/%s", job_id)
         
-        # Wait for job to complete
+        # Wait for job to complete: prefer the Runtime's own event-driven
+        # wait (one server-side subscription) over polling, and back off
+        # exponentially when polling is the only option so long queue
+        # waits don't hammer the API with a round-trip every 5 seconds
         logger.info("Waiting for job to complete...")
-        job_status = job.status()
-        while job_status not in ["DONE", "ERROR", "CANCELLED"]:
-            time.sleep(5)
+        if hasattr(job, 'wait_for_final_state'):
+            job.wait_for_final_state()
             job_status = job.status()
-            logger.info(f"Current status: {job_status}")
-            
+        else:
+            delay = 1.0
+            job_status = job.status()
+            while job_status not in ["DONE", "ERROR", "CANCELLED"]:
+                time.sleep(delay)
+                delay = min(delay * 1.7, 30.0)
+                job_status = job.status()
+                logger.info("Current status: %s", job_status)
+
         if job_status == "DONE":
             logger.info("Job completed successfully!")
             
             # Get the result
             result = job.result()
-            logger.info(f"Result type: {type(result)}")
-            logger.info(f"Result attributes: {dir(result)}")
-            
+            logger.info("Result type: %s", type(result))
+            # dir() builds a fresh sorted list of 50+ names; only worth it
+            # when someone is actually reading debug output
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Result attributes: %s", dir(result))
+
             # Try to extract counts using the pattern from the example
             if hasattr(result, '_pub_results') and result._pub_results:
-                logger.info(f"_pub_results length: {len(result._pub_results)}")
-                
-                if len(result._pub_results) > 0:
-                    pub_result = result._pub_results[0]
-                    logger.info(f"pub_result type: {type(pub_result)}")
-                    logger.info(f"pub_result attributes: {dir(pub_result)}")
-                    
-                    # Get classical register name
-                    creg_name = None
-                    if circuit.cregs:
-                        creg_name = circuit.cregs[0].name
-                        
-                    logger.info(f"Classical register name: {creg_name}")
-                    
-                    # Try to extract counts as shown in the example
-                    if hasattr(pub_result, 'data'):
-                        logger.info(f"pub_result.data attributes: {dir(pub_result.data)}")
-                        
-                        # Check if data has the classical register
-                        if hasattr(pub_result.data, creg_name):
-                            creg_data = getattr(pub_result.data, creg_name)
-                            logger.info(f"creg_data type: {type(creg_data)}")
-                            logger.info(f"creg_data attributes: {dir(creg_data)}")
-                            
-                            # Try to get counts
-                            if hasattr(creg_data, 'get_counts'):
-                                counts = creg_data.get_counts()
-                                logger.info(f"Counts extracted: {counts}")
-                            else:
-                                logger.error("creg_data has no get_counts method")
-                        else:
-                            logger.error(f"pub_result.data has no attribute named {creg_name}")
-                            
-                            # List all available attributes
-                            for attr in dir(pub_result.data):
-                                if not attr.startswith('__'):
-                                    logger.info(f"Available attribute: {attr}")
-                                    
-                                    # Try to access this attribute
-                                    attr_value = getattr(pub_result.data, attr)
-                                    logger.info(f"Attribute value type: {type(attr_value)}")
-                                    
-                                    # If it's something that might contain our data, inspect it
-                                    if not callable(attr_value):
-                                        if hasattr(attr_value, 'get_counts'):
-                                            try:
-                                                counts = attr_value.get_counts()
-                                                logger.info(f"Found counts in {attr}: {counts}")
-                                            except Exception as e:
-                                                logger.error(f"Error getting counts from {attr}: {e}")
-                    else:
-                        logger.error("pub_result has no data attribute")
+                pub_result = result._pub_results[0]
+                logger.info("pub_result type: %s", type(pub_result))
+
+                # Get classical register name
+                creg_name = None
+                if circuit.cregs:
+                    creg_name = circuit.cregs[0].name
+
+                logger.info("Classical register name: %s", creg_name)
+
+                # Fast path: the expected register attribute exists on the
+                # pub data, so no introspection is needed at all
+                data = getattr(pub_result, 'data', None)
+                creg_data = getattr(data, creg_name, None) if (data is not None and creg_name) else None
+                if creg_data is not None and hasattr(creg_data, 'get_counts'):
+                    counts = creg_data.get_counts()
+                    logger.info("Counts extracted: %s", counts)
+                elif data is None:
+                    logger.error("pub_result has no data attribute")
+                else:
+                    logger.error("pub_result.data has no usable attribute named %s", creg_name)
+
+                    # Exhaustive introspection only runs on this failure
+                    # path; the happy path above never pays for dir()
+                    for attr in dir(data):
+                        if not attr.startswith('__'):
+                            logger.info("Available attribute: %s", attr)
+
+                            # Try to access this attribute
+                            attr_value = getattr(data, attr)
+                            logger.info("Attribute value type: %s", type(attr_value))
+
+                            # If it's something that might contain our data, inspect it
+                            if not callable(attr_value):
+                                if hasattr(attr_value, 'get_counts'):
+                                    try:
+                                        counts = attr_value.get_counts()
+                                        logger.info("Found counts in %s: %s", attr, counts)
+                                    except Exception as e:
+                                        logger.error("Error getting counts from %s: %s", attr, e)
             else:
                 logger.error("result has no _pub_results attribute or it's empty")
                 
         else:
-            logger.error(f"Job failed with status: {job_status}")
+            logger.error("Job failed with status: %s", job_status)
     
     except Exception as e:
-        logger.error(f"Error in debug_ibm_quantum: {e}", exc_info=True)
+        logger.error("Error in debug_ibm_quantum: %s", e, exc_info=True)
 
 if __name__ == "__main__":
     debug_ibm_quantum() 
\ No newline at end of file
@@ -5,14 +5,18 @@ Test runner script for the Quantum Computing API.
 This script runs pytest with coverage reporting and provides a summary
 of test results and coverage metrics.
 """
-import os
 import sys
-import subprocess
+from pathlib import Path
 from typing import List, Optional
 
 # Minimum required coverage percentage from PRD
 MIN_COVERAGE = 80
 
+# Directories are ensured once per process: with pytest now running
+# in-process, repeated run_tests calls would otherwise re-issue the
+# stat/mkdir syscall pair per directory on every run
+_DIRS_ENSURED = False
+
 
 def run_tests(args: Optional[List[str]] = None) -> int:
     """
@@ -28,27 +32,39 @@ def run_tests(args: Optional[List[str]] = None) -> int:
         args = []
     
     # Ensure the circuits and results directories exist
-    os.makedirs("circuits", exist_ok=True)
-    os.makedirs("results", exist_ok=True)
+    global _DIRS_ENSURED
+    if not _DIRS_ENSURED:
+        for directory in ("circuits", "results"):
+            Path(directory).mkdir(parents=True, exist_ok=True)
+        _DIRS_ENSURED = True
     
-    # Base command with coverage
-    cmd = [
-        "python", "-m", "pytest",
+    # HTML reports only on demand: the HTML coverage generator writes
+    # one file per source module plus a render pass, the slowest part of
+    # teardown on a no-change rerun
+    with_html = "--with-html" in args
+    args = [arg for arg in args if arg != "--with-html"]
+
+    # Base pytest arguments with coverage
+    pytest_args = [
         "--cov=app",
         "--cov-report=term",
-        "--cov-report=html:coverage_report",
-        "--html=test_report.html",
-        "--self-contained-html",
         "-v"
-]
-    
+    ]
+    if with_html:
+        pytest_args.extend([
+            "--cov-report=html:coverage_report",
+            "--html=test_report.html",
+            "--self-contained-html",
+        ])
+
     # Add any additional arguments
     if args:
-        cmd.extend(args)
-    
-    # Run the tests
-    result = subprocess.run(cmd)
-    return result.returncode
+        pytest_args.extend(args)
+
+    # Run pytest in-process: the old subprocess invocation paid full
+    # interpreter startup plus a re-import of the app package per run
+    import pytest
+    return pytest.main(pytest_args)
 
 
 if __name__ == "__main__":
@@ -65,17 +81,25 @@ if __name__ == "__main__":
         print("\n✅ All tests passed!")
         
         try:
-            # Check if we met the coverage threshold
-            with open(".coverage", "r") as f:
-                if f.read().find(f"\"percent_covered\": {MIN_COVERAGE}") >= 0:
-                    print(f"✅ Coverage meets minimum requirement of {MIN_COVERAGE}%")
-                else:
-                    print(f"⚠️ Coverage might be below the minimum requirement of {MIN_COVERAGE}%")
-                    print("   Check the full coverage report for details")
-        except:
+            # Check the threshold through the coverage API: the old
+            # substring search over the raw .coverage file only matched a
+            # percentage of exactly 80 and breaks on the SQLite data
+            # format recent coverage versions use
+            import io
+            import coverage
+            cov = coverage.Coverage()
+            cov.load()
+            percent = cov.report(show_missing=False, file=io.StringIO())
+            if percent >= MIN_COVERAGE:
+                print(f"✅ Coverage meets minimum requirement of {MIN_COVERAGE}%")
+            else:
+                print(f"⚠️ Coverage {percent:.1f}% is below the minimum requirement of {MIN_COVERAGE}%")
+                print("   Check the full coverage report for details")
+        except Exception:
             print("⚠️ Could not determine coverage percentage from report")
         
-        print("\nCoverage report generated in: ./coverage_report/index.html")
+        if "--with-html" in args:
+            print("\nCoverage report generated in: ./coverage_report/index.html")
     else:
         print("\n❌ Some tests failed!")
     
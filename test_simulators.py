@@ -2,64 +2,75 @@
 """
 Test script for all supported quantum simulators.
 """
-import requests
+import asyncio
 import json
-import time
+import httpx
 from typing import Dict, Any
 
 API_URL = "http://localhost:8889/api/v1/circuits/execute"
 
-def test_simulator(provider: str) -> Dict[str, Any]:
+# The QASM file is immutable during a run; read it once, on first use
+_CIRCUIT: str = ""
+
+
+def _load_circuit() -> str:
+    """Return the test circuit content, reading the file only once."""
+    global _CIRCUIT
+    if not _CIRCUIT:
+        with open("test_circuit.qasm", "r") as f:
+            _CIRCUIT = f.read()
+    return _CIRCUIT
+
+
+async def test_simulator(client: httpx.AsyncClient, provider: str) -> Dict[str, Any]:
     """
     Test a specific quantum simulator.
-    
+
     Args:
+        client: Shared HTTP client with pooled keep-alive connections
         provider: The simulator provider (qiskit, cirq, braket)
-        
+
     Returns:
         API response
     """
     print(f"\n===== Testing {provider} simulator =====")
-    
-    # Read the QASM file
-    with open("test_circuit.qasm", "r") as f:
-        circuit = f.read()
-    
+
     # Create the payload
     payload = {
-        "circuit_file": circuit,
+        "circuit_file": _load_circuit(),
         "shots": 1024,
         "backend_type": "simulator",
         "backend_provider": provider,
         "async_mode": False
     }
-    
+
     # Make the API call
     print(f"Sending request to {provider} simulator...")
-    response = requests.post(
+    response = await client.post(
         API_URL,
         json=payload,
         headers={"Content-Type": "application/json"}
     )
-    
+
     # Print response
     result = response.json()
     print(json.dumps(result, indent=2))
-    
+
     print(f"===== {provider} test complete =====\n")
     return result
 
-def main():
-    """Test all supported simulators."""
-    # Test each supported simulator
+
+async def main():
+    """Test all supported simulators concurrently."""
+    # The three provider requests are independent, so fire them together:
+    # total wall time becomes the slowest round-trip instead of the sum
+    # of all three plus artificial sleeps
     providers = ["qiskit", "cirq", "braket"]
-    
-    for provider in providers:
-        result = test_simulator(provider)
-        # Add a small delay between requests
-        time.sleep(1)
-    
+
+    async with httpx.AsyncClient() as client:
+        await asyncio.gather(*(test_simulator(client, p) for p in providers))
+
     print("All simulator tests completed!")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
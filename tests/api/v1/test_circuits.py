@@ -5,7 +5,7 @@ This module contains tests for the /api/v1/circuits/execute endpoint.
 """
 import json
 import pytest
-from typing import Dict, Any
+from typing import Any, Callable, Dict
 from unittest import mock
 from fastapi.testclient import TestClient
 from fastapi import status
@@ -15,7 +15,7 @@ from app.schemas.circuit import JobStatus
 
 def test_execute_circuit_sync_success(
     test_client: TestClient, 
-    valid_circuit_execution_payload: Dict[str, Any],
+    valid_circuit_execution_payload: Callable[..., Dict[str, Any]],
     available_simulators: Dict[str, bool]
 ):
     """
@@ -24,14 +24,16 @@ def test_execute_circuit_sync_success(
     Verifies that a circuit can be executed synchronously and returns
     proper execution results.
     """
+    payload = valid_circuit_execution_payload()
+    
     # Skip test if the requested simulator is not available
-    provider = valid_circuit_execution_payload["backend_provider"]
+    provider = payload["backend_provider"]
     if not available_simulators.get(provider, False):
         pytest.skip(f"{provider} simulator not available")
     
     response = test_client.post(
         "/api/v1/circuits/execute",
-        json=valid_circuit_execution_payload
+        json=payload
     )
     
     assert response.status_code == status.HTTP_200_OK
@@ -58,12 +60,12 @@ def test_execute_circuit_sync_success(
         metadata = result_data["metadata"]
         assert metadata["backend_type"] == "simulator"
         assert metadata["backend_provider"] == provider
-        assert metadata["shots"] == valid_circuit_execution_payload["shots"]
+        assert metadata["shots"] == payload["shots"]
 
 
 def test_execute_circuit_async_success(
     test_client: TestClient, 
-    valid_circuit_execution_payload: Dict[str, Any],
+    valid_circuit_execution_payload: Callable[..., Dict[str, Any]],
     available_simulators: Dict[str, bool]
 ):
     """
@@ -72,15 +74,13 @@ def test_execute_circuit_async_success(
     Verifies that a circuit can be queued for asynchronous execution and
     returns a valid job ID.
     """
+    payload = valid_circuit_execution_payload(async_mode=True)
+    
     # Skip test if the requested simulator is not available
-    provider = valid_circuit_execution_payload["backend_provider"]
+    provider = payload["backend_provider"]
     if not available_simulators.get(provider, False):
         pytest.skip(f"{provider} simulator not available")
     
-    # Modify the payload for async execution
-    payload = valid_circuit_execution_payload.copy()
-    payload["async_mode"] = True
-    
     response = test_client.post(
         "/api/v1/circuits/execute",
         json=payload
@@ -104,16 +104,15 @@ def test_execute_circuit_async_success(
 
 def test_execute_circuit_invalid_backend_type(
     test_client: TestClient, 
-    valid_circuit_execution_payload: Dict[str, Any]
+    valid_circuit_execution_payload: Callable[..., Dict[str, Any]]
 ):
     """
     Test circuit execution with invalid backend type.
     
     Verifies that proper validation error is returned for invalid backend type.
     """
-    # Modify the payload with invalid backend type
-    payload = valid_circuit_execution_payload.copy()
-    payload["backend_type"] = "invalid_type"
+    # Build the payload with an invalid backend type
+    payload = valid_circuit_execution_payload(backend_type="invalid_type")
     
     response = test_client.post(
         "/api/v1/circuits/execute",
@@ -134,16 +133,15 @@ def test_execute_circuit_invalid_backend_type(
 
 def test_execute_circuit_invalid_backend_provider(
     test_client: TestClient, 
-    valid_circuit_execution_payload: Dict[str, Any]
+    valid_circuit_execution_payload: Callable[..., Dict[str, Any]]
 ):
     """
     Test circuit execution with invalid backend provider.
     
     Verifies that proper error is returned for invalid backend provider.
     """
-    # Modify the payload with invalid backend provider
-    payload = valid_circuit_execution_payload.copy()
-    payload["backend_provider"] = "invalid_provider"
+    # Build the payload with an invalid backend provider
+    payload = valid_circuit_execution_payload(backend_provider="invalid_provider")
     
     response = test_client.post(
         "/api/v1/circuits/execute",
@@ -155,23 +153,26 @@ def test_execute_circuit_invalid_backend_provider(
     
     data = response.json()
     assert "detail" in data
-    assert "provider" in data["detail"].lower()
+    # Structured detail from raise_api_error: {"code": ..., "message": ...}
+    assert data["detail"]["code"] == "VALIDATION_ERROR"
+    assert "provider" in data["detail"]["message"].lower()
 
 
 def test_execute_circuit_hardware_backend(
     test_client: TestClient, 
-    valid_circuit_execution_payload: Dict[str, Any]
+    valid_circuit_execution_payload: Callable[..., Dict[str, Any]]
 ):
     """
     Test circuit execution with hardware backend.
     
     Verifies validation for hardware backend providers.
     """
-    # Modify the payload to use hardware backend
-    payload = valid_circuit_execution_payload.copy()
-    payload["backend_type"] = "hardware"
-    payload["backend_provider"] = "ibm"
-    payload["backend_name"] = "ibmq_qasm_simulator"  # A common IBM simulator
+    # Build the payload for a hardware backend
+    payload = valid_circuit_execution_payload(
+        backend_type="hardware",
+        backend_provider="ibm",
+        backend_name="ibmq_qasm_simulator",  # A common IBM simulator
+    )
     
     response = test_client.post(
         "/api/v1/circuits/execute",
@@ -187,16 +188,15 @@ def test_execute_circuit_hardware_backend(
 
 def test_execute_circuit_shots_validation(
     test_client: TestClient, 
-    valid_circuit_execution_payload: Dict[str, Any]
+    valid_circuit_execution_payload: Callable[..., Dict[str, Any]]
 ):
     """
     Test circuit execution with invalid shot count.
     
     Verifies validation for the shots parameter.
     """
-    # Modify the payload with invalid (negative) shots
-    payload = valid_circuit_execution_payload.copy()
-    payload["shots"] = -1
+    # Build the payload with invalid (negative) shots
+    payload = valid_circuit_execution_payload(shots=-1)
     
     response = test_client.post(
         "/api/v1/circuits/execute",
@@ -215,24 +215,20 @@ def test_execute_circuit_shots_validation(
 
 def test_execute_circuit_empty_circuit(
     test_client: TestClient, 
-    valid_circuit_execution_payload: Dict[str, Any]
+    valid_circuit_execution_payload: Callable[..., Dict[str, Any]]
 ):
     """
     Test circuit execution with empty circuit.
     
     Verifies proper error handling for empty circuit content.
     """
-    # Modify the payload with empty circuit
-    payload = valid_circuit_execution_payload.copy()
-    payload["circuit_file"] = ""
+    # Build the payload with an empty circuit
+    payload = valid_circuit_execution_payload(circuit_file="")
     
     response = test_client.post(
         "/api/v1/circuits/execute",
         json=payload
     )
     
-    # Should return error for empty circuit
-    assert response.status_code in [
-        status.HTTP_400_BAD_REQUEST, 
-        status.HTTP_422_UNPROCESSABLE_ENTITY
-    ]
+    # Rejected by request-model validation before reaching the executor
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
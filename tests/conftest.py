@@ -7,7 +7,8 @@ import os
 import sys
 import pytest
 from fastapi.testclient import TestClient
-from typing import Dict, Generator, Any
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Generator, Mapping
 
 # Add the project root to the Python path to ensure imports work properly
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -18,11 +19,15 @@ from app.services.circuit_executor import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_client() -> Generator[TestClient, None, None]:
     """
     Create a FastAPI TestClient for API testing.
     
+    Session-scoped: entering the client context runs FastAPI startup and
+    middleware assembly, which the read-only API tests here have no
+    reason to repeat per test.
+    
     Returns:
         TestClient: A TestClient instance for the FastAPI app
     """
@@ -30,11 +35,14 @@ def test_client() -> Generator[TestClient, None, None]:
         yield client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_qasm_circuit() -> str:
     """
     Load the sample Shor's algorithm QASM circuit.
     
+    Session-scoped: the file is immutable across a test run, so it is
+    read once instead of once per test.
+    
     Returns:
         str: The QASM circuit content
     """
@@ -48,38 +56,68 @@ def sample_qasm_circuit() -> str:
         return f.read()
 
 
-@pytest.fixture
-def available_simulators() -> Dict[str, bool]:
+@pytest.fixture(scope="session")
+def sample_circuit_obj(sample_qasm_circuit: str) -> Any:
     """
-    Get a dictionary of available quantum simulators.
+    Parse the sample circuit into a QuantumCircuit once per session.
+    
+    Lets executor tests reuse the parsed circuit instead of re-running
+    the QASM parser each test.
     
     Returns:
-        Dict[str, bool]: Dictionary with simulator availability
+        The parsed qiskit QuantumCircuit
     """
-    return {
-        "qiskit": check_provider_availability("qiskit"),
-        "cirq": check_provider_availability("cirq"),
-        "braket": check_provider_availability("braket")
-    }
+    if not check_provider_availability("qiskit"):
+        pytest.skip("Qiskit is not available")
+    from qiskit import QuantumCircuit
+    return QuantumCircuit.from_qasm_str(sample_qasm_circuit)
+
+
+# Provider availability is a process-lifetime constant (it reflects what
+# is importable), so it is computed once at conftest import and frozen:
+# every test reads the same mapping and none can mutate what another sees
+_AVAILABLE_SIMULATORS = MappingProxyType({
+    provider: check_provider_availability(provider)
+    for provider in ("qiskit", "cirq", "braket")
+})
+
+
+@pytest.fixture(scope="session")
+def available_simulators() -> Mapping[str, bool]:
+    """
+    Get the read-only mapping of available quantum simulators.
+    
+    Returns:
+        Mapping[str, bool]: Immutable mapping with simulator availability
+    """
+    return _AVAILABLE_SIMULATORS
 
 
 @pytest.fixture
-def valid_circuit_execution_payload(sample_qasm_circuit: str) -> Dict[str, Any]:
+def valid_circuit_execution_payload(sample_qasm_circuit: str) -> Callable[..., Dict[str, Any]]:
     """
-    Generate a valid circuit execution payload.
+    Build valid circuit execution payloads.
+    
+    Returns a factory: calling it yields a fresh valid payload, and
+    keyword arguments override individual fields, so negative-path tests
+    build their variant in one call instead of copy-then-mutate.
     
     Args:
         sample_qasm_circuit: The QASM circuit content
     
     Returns:
-        Dict[str, Any]: A valid circuit execution request
+        Callable[..., Dict[str, Any]]: Payload factory accepting overrides
     """
-    return {
-        "circuit_file": sample_qasm_circuit,
-        "shots": 1024,
-        "backend_type": "simulator",
-        "backend_provider": "qiskit",
-        "backend_name": None,
-        "async_mode": False,
-        "parameters": {}
-    }
+    def _make(**overrides: Any) -> Dict[str, Any]:
+        payload = {
+            "circuit_file": sample_qasm_circuit,
+            "shots": 1024,
+            "backend_type": "simulator",
+            "backend_provider": "qiskit",
+            "backend_name": None,
+            "async_mode": False,
+            "parameters": {}
+        }
+        payload.update(overrides)
+        return payload
+    return _make
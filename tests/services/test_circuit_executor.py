@@ -41,109 +41,41 @@ def test_check_provider_availability():
     assert check_provider_availability("invalid_provider") == False
 
 
-@pytest.mark.asyncio
-async def test_execute_circuit_with_qiskit(sample_qasm_circuit: str):
-    """
-    Test Qiskit circuit executor.
-    
-    Verifies that the function can execute a circuit using Qiskit.
-    """
-    if not check_provider_availability("qiskit"):
-        pytest.skip("Qiskit is not available")
-    
-    # Create temporary file with the circuit
-    with tempfile.NamedTemporaryFile(mode="w+", suffix=".qasm", delete=False) as f:
-        f.write(sample_qasm_circuit)
-        circuit_path = f.name
-    
-    try:
-        # Execute circuit
-        parameters = {}
-        shots = 1024
-        
-        result = await execute_circuit_with_qiskit(circuit_path, parameters, shots)
-        
-        # Validate result
-        assert isinstance(result, dict)
-        
-        # Verify all counts add up to the number of shots (or close to it)
-        total_counts = sum(result.values())
-        assert abs(total_counts - shots) <= shots * 0.1  # Allow for small variations
-    
-    finally:
-        # Clean up the temporary file
-        if os.path.exists(circuit_path):
-            os.unlink(circuit_path)
+_EXECUTORS = {
+    "qiskit": execute_circuit_with_qiskit,
+    "cirq": execute_circuit_with_cirq,
+    "braket": execute_circuit_with_braket,
+}
 
 
 @pytest.mark.asyncio
-async def test_execute_circuit_with_cirq(sample_qasm_circuit: str):
-    """
-    Test Cirq circuit executor.
-    
-    Verifies that the function can execute a circuit using Cirq.
+@pytest.mark.parametrize("provider", ["qiskit", "cirq", "braket"])
+async def test_execute_circuit_with_provider(provider: str, sample_qasm_circuit: str):
     """
-    if not check_provider_availability("cirq"):
-        pytest.skip("Cirq is not available")
-    
-    # Create temporary file with the circuit
-    with tempfile.NamedTemporaryFile(mode="w+", suffix=".qasm", delete=False) as f:
-        f.write(sample_qasm_circuit)
-        circuit_path = f.name
-    
-    try:
-        # Execute circuit
-        parameters = {}
-        shots = 1024
-        
-        result = await execute_circuit_with_cirq(circuit_path, parameters, shots)
-        
-        # Validate result
-        assert isinstance(result, dict)
-        
-        # Verify all counts add up approximately to the number of shots
-        total_counts = sum(result.values())
-        assert abs(total_counts - shots) <= shots * 0.1  # Allow for small variations
+    Test the simulator circuit executors.
     
-    finally:
-        # Clean up the temporary file
-        if os.path.exists(circuit_path):
-            os.unlink(circuit_path)
-
-
-@pytest.mark.asyncio
-async def test_execute_circuit_with_braket(sample_qasm_circuit: str):
+    Verifies that each provider's executor can run the sample circuit;
+    parametrized over the providers since the bodies are identical.
     """
-    Test Braket circuit executor.
+    if not check_provider_availability(provider):
+        pytest.skip(f"{provider} is not available")
     
-    Verifies that the function can execute a circuit using Braket.
-    """
-    if not check_provider_availability("braket"):
-        pytest.skip("Braket is not available")
+    # Pass the QASM content directly instead of round-tripping it
+    # through a temporary file
+    parameters = {}
+    shots = 1024
     
-    # Create temporary file with the circuit
-    with tempfile.NamedTemporaryFile(mode="w+", suffix=".qasm", delete=False) as f:
-        f.write(sample_qasm_circuit)
-        circuit_path = f.name
+    result = await _EXECUTORS[provider](
+        "sample_circuit.qasm", parameters, shots,
+        circuit_content=sample_qasm_circuit,
+    )
     
-    try:
-        # Execute circuit
-        parameters = {}
-        shots = 1024
-        
-        result = await execute_circuit_with_braket(circuit_path, parameters, shots)
-        
-        # Validate result
-        assert isinstance(result, dict)
-        
-        # Verify all counts add up to the number of shots (or close to it)
-        total_counts = sum(result.values())
-        assert abs(total_counts - shots) <= shots * 0.1  # Allow for small variations
+    # Validate result
+    assert isinstance(result, dict)
     
-    finally:
-        # Clean up the temporary file
-        if os.path.exists(circuit_path):
-            os.unlink(circuit_path)
+    # Verify all counts add up to the number of shots (or close to it)
+    total_counts = sum(result.values())
+    assert abs(total_counts - shots) <= shots * 0.1  # Allow for small variations
 
 
 @pytest.mark.asyncio